@@ -7,14 +7,23 @@ Provides endpoints for:
 - Testing agents with simple tasks
 """
 
+import asyncio
+import hashlib
+from itertools import groupby
+from operator import attrgetter
 from datetime import datetime
-from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from types import MappingProxyType
+from typing import Dict, Optional, List
+
+import msgspec
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.db.models import User, AgentProfile
 from app.auth.deps import get_current_active_user
 from app.services.api_key_storage import get_user_api_keys as get_file_api_keys
@@ -26,7 +35,7 @@ router = APIRouter()
 # Default Agent Configurations (from nexen/config/agents.py)
 # =============================================================================
 
-DEFAULT_AGENTS = [
+_DEFAULT_AGENT_CONFIGS = [
     {
         "agent_type": "meta_coordinator",
         "display_name": "Meta-Coordinator",
@@ -240,6 +249,15 @@ DEFAULT_AGENTS = [
 ]
 
 
+# Read-only views of the defaults, plus an agent_type index for O(1) lookups
+DEFAULT_AGENTS = tuple(MappingProxyType(agent) for agent in _DEFAULT_AGENT_CONFIGS)
+DEFAULT_AGENTS_BY_TYPE = MappingProxyType({agent["agent_type"]: agent for agent in DEFAULT_AGENTS})
+
+# The defaults never change at runtime, so encode the defaults payload once
+_DEFAULTS_JSON = orjson.dumps({"agents": _DEFAULT_AGENT_CONFIGS, "total": len(_DEFAULT_AGENT_CONFIGS)})
+_DEFAULTS_ETAG = f'"{hashlib.sha256(_DEFAULTS_JSON).hexdigest()[:32]}"'
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -316,8 +334,32 @@ class AgentProfileResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AgentProfileRow(msgspec.Struct):
+    """Slotted mirror of AgentProfileResponse for encoding list payloads with msgspec."""
+
+    id: str
+    user_id: str
+    agent_type: str
+    display_name: str
+    display_name_cn: str
+    cluster: str
+    is_custom: bool
+    role_model: str
+    fallback_model: Optional[str]
+    temperature: float
+    max_tokens: int
+    persona: str
+    traits: dict
+    responsibilities: List[str]
+    pipeline_config: dict
+    data_sources: List[str]
+    enabled_skills: List[str]
+    is_enabled: bool
+    created_at: datetime
+    updated_at: datetime
 
 
 class AgentProfileListResponse(BaseModel):
@@ -325,6 +367,16 @@ class AgentProfileListResponse(BaseModel):
     total: int
 
 
+class AgentProfileGroupedResponse(BaseModel):
+    clusters: Dict[str, List[AgentProfileResponse]]
+    total: int
+
+
+class InitDefaultsResponse(BaseModel):
+    message: str
+    count: int
+
+
 class AgentTestRequest(BaseModel):
     task: str = Field(..., min_length=1, max_length=1000)
 
@@ -348,61 +400,120 @@ def get_user_api_keys_for_agent(user_id: str) -> dict[str, str]:
     return {k: v for k, v in api_keys.items() if v}
 
 
+_RESPONSE_FIELDS = tuple(AgentProfileResponse.model_fields)
+
+# Core columns selected for list endpoints, in AgentProfileRow field order
+_PROFILE_ROW_COLUMNS = tuple(AgentProfile.__table__.c[name] for name in AgentProfileRow.__struct_fields__)
+_msgspec_encoder = msgspec.json.Encoder()
+
+# Columns copied verbatim when cloning; the rest are set explicitly for the copy
+_CLONE_SKIP = frozenset({
+    "id", "user_id", "created_at", "updated_at",
+    "agent_type", "display_name", "display_name_cn", "is_custom", "is_enabled",
+})
+_CLONE_FIELDS = tuple(c.key for c in AgentProfile.__table__.columns if c.key not in _CLONE_SKIP)
+
+# Model provider prefix -> API key name in key storage
+_PROVIDER_KEYS = {
+    "openai": "openai",
+    "gpt": "openai",
+    "anthropic": "anthropic",
+    "claude": "anthropic",
+    "google": "google",
+    "gemini": "google",
+    "deepseek": "deepseek",
+    "qwen": "dashscope",
+    "dashscope": "dashscope",
+}
+_PROVIDER_BASE_URLS = {"deepseek": "https://api.deepseek.com/v1"}
+# Tried in order when the profile's own provider has no key
+_FALLBACK_MODELS = (
+    ("openai", "openai/gpt-4o"),
+    ("deepseek", "deepseek/deepseek-chat"),
+)
+
+
+def model_provider(model: str) -> str:
+    """Provider prefix of a model name: "openai/gpt-4o" -> "openai", "claude-3-opus" -> "claude"."""
+    head, sep, _ = model.partition("/")
+    return (head if sep else model.partition("-")[0]).lower()
+
+
+def provider_key_name(model: str) -> Optional[str]:
+    """Name of the API key that serves ``model`` ("openai", "anthropic", ...), if known."""
+    return _PROVIDER_KEYS.get(model_provider(model))
+
+
+def _msgspec_response(payload: dict) -> Response:
+    """Encode a payload of AgentProfileRow structs with msgspec."""
+    return Response(_msgspec_encoder.encode(payload), media_type="application/json")
+
+
+def profile_to_response(profile: AgentProfile) -> AgentProfileResponse:
+    """Build a response from a DB row without re-running validation.
+
+    Rows come from our own database and were validated on write, so the
+    read path uses model_construct() instead of model_validate().
+    """
+    return AgentProfileResponse.model_construct(
+        **{name: getattr(profile, name) for name in _RESPONSE_FIELDS}
+    )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
 
-@router.get("/profiles/defaults")
-async def get_default_agents():
+@router.get("/profiles/defaults", response_class=Response)
+async def get_default_agents(if_none_match: Optional[str] = Header(None)):
     """Get all 14 default agent configurations."""
-    return {"agents": DEFAULT_AGENTS, "total": len(DEFAULT_AGENTS)}
+    if if_none_match == _DEFAULTS_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": _DEFAULTS_ETAG})
+    return Response(_DEFAULTS_JSON, media_type="application/json", headers={"ETag": _DEFAULTS_ETAG})
 
 
 @router.get("/profiles", response_model=AgentProfileListResponse)
 async def get_agent_profiles(
     cluster: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all agent profiles for the current user."""
-    query = db.query(AgentProfile).filter(AgentProfile.user_id == current_user.id)
+    stmt = select(*_PROFILE_ROW_COLUMNS).where(AgentProfile.user_id == current_user.id)
 
     if cluster:
-        query = query.filter(AgentProfile.cluster == cluster)
-
-    profiles = query.order_by(AgentProfile.created_at.desc()).all()
-
-    return AgentProfileListResponse(
-        profiles=[AgentProfileResponse(
-            id=p.id,
-            user_id=p.user_id,
-            agent_type=p.agent_type,
-            display_name=p.display_name,
-            display_name_cn=p.display_name_cn,
-            cluster=p.cluster,
-            is_custom=p.is_custom,
-            role_model=p.role_model,
-            fallback_model=p.fallback_model,
-            temperature=p.temperature,
-            max_tokens=p.max_tokens,
-            persona=p.persona,
-            traits=p.traits or {},
-            responsibilities=p.responsibilities or [],
-            pipeline_config=p.pipeline_config or {},
-            data_sources=p.data_sources or [],
-            enabled_skills=p.enabled_skills or [],
-            is_enabled=p.is_enabled,
-            created_at=p.created_at,
-            updated_at=p.updated_at,
-        ) for p in profiles],
-        total=len(profiles)
+        stmt = stmt.where(AgentProfile.cluster == cluster)
+
+    result = await db.execute(stmt.order_by(AgentProfile.created_at.desc()))
+    profiles = [AgentProfileRow(*row) for row in result]
+
+    return _msgspec_response({"profiles": profiles, "total": len(profiles)})
+
+
+@router.get("/profiles/grouped", response_model=AgentProfileGroupedResponse)
+async def get_agent_profiles_grouped(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Get all agent profiles for the current user, grouped by cluster."""
+    result = await db.execute(
+        select(*_PROFILE_ROW_COLUMNS)
+        .where(AgentProfile.user_id == current_user.id)
+        .order_by(AgentProfile.cluster, AgentProfile.created_at.desc())
     )
+    profiles = [AgentProfileRow(*row) for row in result]
+
+    clusters = {
+        cluster: list(group)
+        for cluster, group in groupby(profiles, key=attrgetter("cluster"))
+    }
+    return _msgspec_response({"clusters": clusters, "total": len(profiles)})
 
 
 @router.post("/profiles", response_model=AgentProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_agent_profile(
     request: AgentProfileCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Create a custom agent profile."""
@@ -426,321 +537,212 @@ async def create_agent_profile(
         is_enabled=True,
     )
     db.add(profile)
-    db.commit()
-    db.refresh(profile)
-
-    return AgentProfileResponse(
-        id=profile.id,
-        user_id=profile.user_id,
-        agent_type=profile.agent_type,
-        display_name=profile.display_name,
-        display_name_cn=profile.display_name_cn,
-        cluster=profile.cluster,
-        is_custom=profile.is_custom,
-        role_model=profile.role_model,
-        fallback_model=profile.fallback_model,
-        temperature=profile.temperature,
-        max_tokens=profile.max_tokens,
-        persona=profile.persona,
-        traits=profile.traits or {},
-        responsibilities=profile.responsibilities or [],
-        pipeline_config=profile.pipeline_config or {},
-        data_sources=profile.data_sources or [],
-        enabled_skills=profile.enabled_skills or [],
-        is_enabled=profile.is_enabled,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-    )
+    await db.commit()
+    await db.refresh(profile)
+
+    return profile_to_response(profile)
 
 
 @router.get("/profiles/{profile_id}", response_model=AgentProfileResponse)
 async def get_agent_profile(
     profile_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Get a specific agent profile."""
-    profile = db.query(AgentProfile).filter(
-        AgentProfile.id == profile_id,
-        AgentProfile.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(AgentProfile).where(
+            AgentProfile.id == profile_id,
+            AgentProfile.user_id == current_user.id
+        )
+    )
+    profile = result.scalar_one_or_none()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Agent profile not found")
 
-    return AgentProfileResponse(
-        id=profile.id,
-        user_id=profile.user_id,
-        agent_type=profile.agent_type,
-        display_name=profile.display_name,
-        display_name_cn=profile.display_name_cn,
-        cluster=profile.cluster,
-        is_custom=profile.is_custom,
-        role_model=profile.role_model,
-        fallback_model=profile.fallback_model,
-        temperature=profile.temperature,
-        max_tokens=profile.max_tokens,
-        persona=profile.persona,
-        traits=profile.traits or {},
-        responsibilities=profile.responsibilities or [],
-        pipeline_config=profile.pipeline_config or {},
-        data_sources=profile.data_sources or [],
-        enabled_skills=profile.enabled_skills or [],
-        is_enabled=profile.is_enabled,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-    )
+    return profile_to_response(profile)
 
 
 @router.put("/profiles/{profile_id}", response_model=AgentProfileResponse)
+@router.patch("/profiles/{profile_id}", response_model=AgentProfileResponse)
 async def update_agent_profile(
     profile_id: str,
     request: AgentProfileUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Update an agent profile."""
-    profile = db.query(AgentProfile).filter(
-        AgentProfile.id == profile_id,
-        AgentProfile.user_id == current_user.id
-    ).first()
+    owned = (AgentProfile.id == profile_id, AgentProfile.user_id == current_user.id)
+    # Only the fields the client sent; an explicit null still means "leave unchanged"
+    changes = request.model_dump(exclude_unset=True, exclude_none=True)
+
+    if changes:
+        # Single UPDATE ... RETURNING instead of SELECT + UPDATE
+        result = await db.execute(
+            update(AgentProfile).where(*owned).values(**changes).returning(AgentProfile)
+        )
+    else:
+        result = await db.execute(select(AgentProfile).where(*owned))
+    profile = result.scalar_one_or_none()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Agent profile not found")
 
-    # Update fields
-    if request.display_name is not None:
-        profile.display_name = request.display_name
-    if request.display_name_cn is not None:
-        profile.display_name_cn = request.display_name_cn
-    if request.role_model is not None:
-        profile.role_model = request.role_model
-    if request.fallback_model is not None:
-        profile.fallback_model = request.fallback_model
-    if request.temperature is not None:
-        profile.temperature = request.temperature
-    if request.max_tokens is not None:
-        profile.max_tokens = request.max_tokens
-    if request.persona is not None:
-        profile.persona = request.persona
-    if request.traits is not None:
-        profile.traits = request.traits
-    if request.responsibilities is not None:
-        profile.responsibilities = request.responsibilities
-    if request.pipeline_config is not None:
-        profile.pipeline_config = request.pipeline_config
-    if request.data_sources is not None:
-        profile.data_sources = request.data_sources
-    if request.enabled_skills is not None:
-        profile.enabled_skills = request.enabled_skills
-    if request.is_enabled is not None:
-        profile.is_enabled = request.is_enabled
-
-    db.commit()
-    db.refresh(profile)
-
-    return AgentProfileResponse(
-        id=profile.id,
-        user_id=profile.user_id,
-        agent_type=profile.agent_type,
-        display_name=profile.display_name,
-        display_name_cn=profile.display_name_cn,
-        cluster=profile.cluster,
-        is_custom=profile.is_custom,
-        role_model=profile.role_model,
-        fallback_model=profile.fallback_model,
-        temperature=profile.temperature,
-        max_tokens=profile.max_tokens,
-        persona=profile.persona,
-        traits=profile.traits or {},
-        responsibilities=profile.responsibilities or [],
-        pipeline_config=profile.pipeline_config or {},
-        data_sources=profile.data_sources or [],
-        enabled_skills=profile.enabled_skills or [],
-        is_enabled=profile.is_enabled,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-    )
+    await db.commit()
+
+    return profile_to_response(profile)
 
 
 @router.delete("/profiles/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_agent_profile(
     profile_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Delete an agent profile."""
-    profile = db.query(AgentProfile).filter(
-        AgentProfile.id == profile_id,
-        AgentProfile.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        delete(AgentProfile).where(
+            AgentProfile.id == profile_id,
+            AgentProfile.user_id == current_user.id
+        ).returning(AgentProfile.id)
+    )
 
-    if not profile:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Agent profile not found")
 
-    db.delete(profile)
-    db.commit()
+    await db.commit()
 
 
 @router.post("/profiles/{profile_id}/clone", response_model=AgentProfileResponse, status_code=status.HTTP_201_CREATED)
 async def clone_agent_profile(
     profile_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Clone an agent profile."""
     # Check if cloning from default or existing profile
-    original = db.query(AgentProfile).filter(
-        AgentProfile.id == profile_id,
-        AgentProfile.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(AgentProfile).where(
+            AgentProfile.id == profile_id,
+            AgentProfile.user_id == current_user.id
+        )
+    )
+    original = result.scalar_one_or_none()
 
     if original:
         # Clone from existing profile
+        copied = {name: getattr(original, name) for name in _CLONE_FIELDS}
         new_profile = AgentProfile(
             user_id=current_user.id,
             agent_type=f"{original.agent_type}_copy",
             display_name=f"{original.display_name} (Copy)",
             display_name_cn=f"{original.display_name_cn} (副本)",
-            cluster=original.cluster,
             is_custom=True,
-            role_model=original.role_model,
-            fallback_model=original.fallback_model,
-            temperature=original.temperature,
-            max_tokens=original.max_tokens,
-            persona=original.persona,
-            traits=original.traits,
-            responsibilities=original.responsibilities,
-            pipeline_config=original.pipeline_config,
-            data_sources=original.data_sources,
-            enabled_skills=original.enabled_skills,
             is_enabled=True,
+            **copied,
         )
     else:
         raise HTTPException(status_code=404, detail="Agent profile not found")
 
     db.add(new_profile)
-    db.commit()
-    db.refresh(new_profile)
-
-    return AgentProfileResponse(
-        id=new_profile.id,
-        user_id=new_profile.user_id,
-        agent_type=new_profile.agent_type,
-        display_name=new_profile.display_name,
-        display_name_cn=new_profile.display_name_cn,
-        cluster=new_profile.cluster,
-        is_custom=new_profile.is_custom,
-        role_model=new_profile.role_model,
-        fallback_model=new_profile.fallback_model,
-        temperature=new_profile.temperature,
-        max_tokens=new_profile.max_tokens,
-        persona=new_profile.persona,
-        traits=new_profile.traits or {},
-        responsibilities=new_profile.responsibilities or [],
-        pipeline_config=new_profile.pipeline_config or {},
-        data_sources=new_profile.data_sources or [],
-        enabled_skills=new_profile.enabled_skills or [],
-        is_enabled=new_profile.is_enabled,
-        created_at=new_profile.created_at,
-        updated_at=new_profile.updated_at,
-    )
+    await db.commit()
+    await db.refresh(new_profile)
+
+    return profile_to_response(new_profile)
 
 
-@router.post("/profiles/init-defaults", status_code=status.HTTP_201_CREATED)
+@router.post("/profiles/init-defaults", response_model=InitDefaultsResponse, status_code=status.HTTP_201_CREATED)
 async def initialize_default_profiles(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Initialize default agent profiles for the current user."""
-    # Check if user already has profiles
-    existing_count = db.query(AgentProfile).filter(
-        AgentProfile.user_id == current_user.id,
-        AgentProfile.is_custom == False
-    ).count()
-
-    if existing_count > 0:
-        return {"message": "Default profiles already initialized", "count": existing_count}
-
-    # Create default profiles
-    created = 0
-    for agent in DEFAULT_AGENTS:
-        profile = AgentProfile(
-            user_id=current_user.id,
-            agent_type=agent["agent_type"],
-            display_name=agent["display_name"],
-            display_name_cn=agent["display_name_cn"],
-            cluster=agent["cluster"],
-            is_custom=False,
-            role_model=agent["role_model"],
-            fallback_model=agent.get("fallback_model"),
-            temperature=agent["temperature"],
-            max_tokens=agent["max_tokens"],
-            persona=agent["persona"],
-            traits=agent["traits"],
-            responsibilities=agent["responsibilities"],
-            pipeline_config={},
-            data_sources=agent["data_sources"],
-            enabled_skills=agent["enabled_skills"],
-            is_enabled=True,
-        )
-        db.add(profile)
-        created += 1
+    # Check if user already has profiles; one row is enough to know
+    already_initialized = await db.scalar(
+        select(AgentProfile.id).where(
+            AgentProfile.user_id == current_user.id,
+            AgentProfile.is_custom == False
+        ).limit(1)
+    )
 
-    db.commit()
-    return {"message": "Default profiles initialized", "count": created}
+    if already_initialized:
+        return {"message": "Default profiles already initialized", "count": len(DEFAULT_AGENTS)}
+
+    # Create default profiles in a single multi-row INSERT
+    rows = [
+        {
+            "user_id": current_user.id,
+            "agent_type": agent["agent_type"],
+            "display_name": agent["display_name"],
+            "display_name_cn": agent["display_name_cn"],
+            "cluster": agent["cluster"],
+            "is_custom": False,
+            "role_model": agent["role_model"],
+            "fallback_model": agent.get("fallback_model"),
+            "temperature": agent["temperature"],
+            "max_tokens": agent["max_tokens"],
+            "persona": agent["persona"],
+            "traits": agent["traits"],
+            "responsibilities": agent["responsibilities"],
+            "pipeline_config": {},
+            "data_sources": agent["data_sources"],
+            "enabled_skills": agent["enabled_skills"],
+            "is_enabled": True,
+        }
+        for agent in DEFAULT_AGENTS
+    ]
+    await db.execute(insert(AgentProfile), rows)
+    await db.commit()
+    return {"message": "Default profiles initialized", "count": len(rows)}
 
 
 @router.post("/profiles/{profile_id}/test", response_model=AgentTestResponse)
 async def test_agent(
     profile_id: str,
     request: AgentTestRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Test an agent with a simple task."""
+    # Deliberately not a module-level import: loading litellm takes seconds and
+    # would be paid on every startup. After the first call this is just a
+    # sys.modules lookup.
     import litellm
 
-    profile = db.query(AgentProfile).filter(
-        AgentProfile.id == profile_id,
-        AgentProfile.user_id == current_user.id
-    ).first()
+    # The profile query and the API key file read are independent; overlap them
+    result, api_keys = await asyncio.gather(
+        db.execute(
+            select(AgentProfile).where(
+                AgentProfile.id == profile_id,
+                AgentProfile.user_id == current_user.id
+            )
+        ),
+        asyncio.to_thread(get_user_api_keys_for_agent, current_user.id),
+    )
+    profile = result.scalar_one_or_none()
 
     if not profile:
         raise HTTPException(status_code=404, detail="Agent profile not found")
 
-    # Get API keys from file storage
-    api_keys = get_user_api_keys_for_agent(current_user.id)
     if not api_keys:
         raise HTTPException(status_code=400, detail="请先在设置页面配置 API Keys")
 
     # Determine model and API key
     model = profile.role_model
-    api_key = None
-    base_url = None
-
-    if "openai" in model and api_keys.get("openai"):
-        api_key = api_keys["openai"]
-    elif "anthropic" in model and api_keys.get("anthropic"):
-        api_key = api_keys["anthropic"]
-    elif "google" in model and api_keys.get("google"):
-        api_key = api_keys["google"]
-    elif "deepseek" in model and api_keys.get("deepseek"):
-        api_key = api_keys["deepseek"]
-        base_url = "https://api.deepseek.com/v1"
-    elif "qwen" in model and api_keys.get("dashscope"):
-        api_key = api_keys["dashscope"]
-    elif api_keys.get("openai"):
-        # Fallback to OpenAI if available
-        model = "openai/gpt-4o"
-        api_key = api_keys["openai"]
-    elif api_keys.get("deepseek"):
-        # Fallback to DeepSeek
-        model = "deepseek/deepseek-chat"
-        api_key = api_keys["deepseek"]
-        base_url = "https://api.deepseek.com/v1"
-    else:
-        raise HTTPException(status_code=400, detail="No suitable API key found for this model")
+    key_name = provider_key_name(model)
+    api_key = api_keys.get(key_name) if key_name else None
+
+    if not api_key:
+        # Fall back to the first provider with a configured key
+        for key_name, fallback_model in _FALLBACK_MODELS:
+            if api_keys.get(key_name):
+                model, api_key = fallback_model, api_keys[key_name]
+                break
+        else:
+            raise HTTPException(status_code=400, detail="No suitable API key found for this model")
+
+    base_url = _PROVIDER_BASE_URLS.get(key_name)
 
     try:
         completion_kwargs = {
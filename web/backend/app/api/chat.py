@@ -84,9 +84,10 @@ async def list_conversations(
     total = query.count()
     conversations = query.offset(skip).limit(limit).all()
 
-    return ConversationListResponse(
+    # Built from our own DB rows, so skip re-validating every field
+    return ConversationListResponse.model_construct(
         conversations=[
-            ConversationResponse(
+            ConversationResponse.model_construct(
                 id=c.id,
                 title=c.title,
                 model=c.model_id,
@@ -149,8 +150,9 @@ async def get_conversation(
         .all()
     )
 
-    return ConversationDetailResponse(
-        conversation=ConversationResponse(
+    # Built from our own DB rows, so skip re-validating every field
+    return ConversationDetailResponse.model_construct(
+        conversation=ConversationResponse.model_construct(
             id=conversation.id,
             title=conversation.title,
             model=conversation.model_id,
@@ -158,7 +160,7 @@ async def get_conversation(
             updated_at=conversation.updated_at,
         ),
         messages=[
-            MessageResponse(
+            MessageResponse.model_construct(
                 id=m.id,
                 conversation_id=m.conversation_id,
                 role=m.role,
@@ -248,25 +250,22 @@ async def send_message(
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Save user message
-    user_message = Message(
-        id=str(uuid4()),
-        conversation_id=conversation_id,
-        role="user",
-        content=request.content,
-    )
-    db.add(user_message)
-
     # Update conversation
     conversation.updated_at = datetime.utcnow()
     if conversation.model_id != request.model:
         conversation.model_id = request.model
 
     # If first message, update title
-    message_count = db.query(Message).filter(Message.conversation_id == conversation_id).count()
-    if message_count == 0:
+    if not conversation.message_count:
         conversation.title = request.content[:50] + ("..." if len(request.content) > 50 else "")
 
+    # Save user message
+    Message.bulk_log(db, conversation_id, [{
+        "id": str(uuid4()),
+        "role": "user",
+        "content": request.content,
+    }])
+
     db.commit()
 
     # Generate AI response (streaming)
@@ -504,16 +503,15 @@ async def send_message(
                         return
 
             # Save assistant message with token usage
-            assistant_message = Message(
-                id=str(uuid4()),
-                conversation_id=conversation_id,
-                role="assistant",
-                content=full_response,
-                model=model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-            )
-            db.add(assistant_message)
+            assistant_message_id = str(uuid4())
+            Message.bulk_log(db, conversation_id, [{
+                "id": assistant_message_id,
+                "role": "assistant",
+                "content": full_response,
+                "model": model,
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+            }])
             db.commit()
 
             # Record usage statistics
@@ -523,7 +521,7 @@ async def send_message(
                 except Exception as e:
                     logger.error(f"Failed to record usage: {e}")
 
-            yield f"data: {json.dumps({'done': True, 'message_id': assistant_message.id, 'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens}})}\n\n"
+            yield f"data: {json.dumps({'done': True, 'message_id': assistant_message_id, 'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens}})}\n\n"
 
         except Exception as e:
             logger.error(f"Error generating response: {e}")
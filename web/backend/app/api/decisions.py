@@ -11,7 +11,7 @@ from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from app.db.database import get_db
 from app.db.models import User, DecisionAnalysis
@@ -103,8 +103,8 @@ class DecisionResponse(BaseModel):
     ai_recommendation: Optional[str]
     ai_analysis: Optional[dict]
     status: str
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
 
 class DecisionListItem(BaseModel):
@@ -114,8 +114,8 @@ class DecisionListItem(BaseModel):
     status: str
     option_count: int
     criteria_count: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
 
 class DecisionListResponse(BaseModel):
@@ -173,7 +173,9 @@ def calculate_weighted_scores(
 
 def analysis_to_response(analysis: DecisionAnalysis) -> DecisionResponse:
     """Convert database model to response."""
-    return DecisionResponse(
+    # options/criteria/weights/scores were validated by the request models when
+    # they were written, so the stored JSON is trusted and not re-validated
+    return DecisionResponse.model_construct(
         id=analysis.id,
         user_id=analysis.user_id,
         title=analysis.title,
@@ -188,8 +190,8 @@ def analysis_to_response(analysis: DecisionAnalysis) -> DecisionResponse:
         ai_recommendation=analysis.ai_recommendation,
         ai_analysis=analysis.ai_analysis,
         status=analysis.status,
-        created_at=analysis.created_at.isoformat() if analysis.created_at else "",
-        updated_at=analysis.updated_at.isoformat() if analysis.updated_at else "",
+        created_at=analysis.created_at,
+        updated_at=analysis.updated_at,
     )
 
 
@@ -206,7 +208,20 @@ async def list_analyses(
     current_user: User = Depends(get_current_active_user),
 ):
     """List all decision analyses for current user."""
-    query = db.query(DecisionAnalysis).filter(DecisionAnalysis.user_id == current_user.id)
+    # List items only need counts of options/criteria; scores, scenarios and
+    # the AI analysis blobs stay on disk
+    query = db.query(DecisionAnalysis).options(
+        load_only(
+            DecisionAnalysis.id,
+            DecisionAnalysis.title,
+            DecisionAnalysis.description,
+            DecisionAnalysis.status,
+            DecisionAnalysis.options,
+            DecisionAnalysis.criteria,
+            DecisionAnalysis.created_at,
+            DecisionAnalysis.updated_at,
+        )
+    ).filter(DecisionAnalysis.user_id == current_user.id)
 
     if status:
         query = query.filter(DecisionAnalysis.status == status)
@@ -214,17 +229,18 @@ async def list_analyses(
     total = query.count()
     analyses = query.order_by(DecisionAnalysis.updated_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
 
-    return DecisionListResponse(
+    # Built from our own DB rows, so skip re-validating every field
+    return DecisionListResponse.model_construct(
         analyses=[
-            DecisionListItem(
+            DecisionListItem.model_construct(
                 id=a.id,
                 title=a.title,
                 description=a.description,
                 status=a.status,
                 option_count=len(a.options) if a.options else 0,
                 criteria_count=len(a.criteria) if a.criteria else 0,
-                created_at=a.created_at.isoformat() if a.created_at else "",
-                updated_at=a.updated_at.isoformat() if a.updated_at else "",
+                created_at=a.created_at,
+                updated_at=a.updated_at,
             )
             for a in analyses
         ],
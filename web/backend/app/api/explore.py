@@ -63,7 +63,7 @@ class SearchHistoryItem(BaseModel):
     id: str
     query: str
     results_count: int
-    created_at: str
+    created_at: datetime
 
 
 class SearchHistoryResponse(BaseModel):
@@ -86,7 +86,7 @@ class DocumentPreviewResponse(BaseModel):
     source: str
     file_type: str
     tags: List[str]
-    created_at: str
+    created_at: datetime
     chunks_count: int
 
 
@@ -256,14 +256,12 @@ async def search(
         ))
 
     # Record search history
-    history = SearchHistory(
-        id=str(uuid4()),
-        user_id=current_user.id,
-        query=request.query,
-        results_count=len(results),
-        filters=request.filters.dict() if request.filters else None
-    )
-    db.add(history)
+    SearchHistory.bulk_log(db, current_user.id, [{
+        "id": str(uuid4()),
+        "query": request.query,
+        "results_count": len(results),
+        "filters": request.filters.dict() if request.filters else None,
+    }])
     db.commit()
 
     query_time_ms = int((time.time() - start_time) * 1000)
@@ -296,7 +294,7 @@ async def get_search_history(
                 id=h.id,
                 query=h.query,
                 results_count=h.results_count,
-                created_at=h.created_at.isoformat() if h.created_at else ""
+                created_at=h.created_at
             )
             for h in history
         ]
@@ -332,24 +330,11 @@ async def get_tags(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all unique tags from user's documents."""
-    documents = (
-        db.query(Document)
-        .filter(Document.user_id == current_user.id)
-        .all()
-    )
-
-    # Aggregate tags
-    tag_counts = {}
-    for doc in documents:
-        if doc.tags:
-            for tag in doc.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-    # Sort by count
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+    # Counted in SQL by expanding each tags array; no Document rows are loaded
+    tag_counts = Document.tag_counts(db, current_user.id)
 
     return TagsResponse(
-        tags=[TagItem(name=name, count=count) for name, count in sorted_tags]
+        tags=[TagItem(name=name, count=count) for name, count in tag_counts]
     )
 
 
@@ -389,6 +374,6 @@ async def preview_document(
         source=source,
         file_type=document.file_type,
         tags=document.tags or [],
-        created_at=document.created_at.isoformat() if document.created_at else "",
+        created_at=document.created_at,
         chunks_count=chunks_count
     )
@@ -11,7 +11,7 @@ from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks, status
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, raiseload, selectinload
 from sqlalchemy import func
 
 from app.db.database import get_db
@@ -61,8 +61,8 @@ class FolderResponse(BaseModel):
     description: Optional[str]
     color: Optional[str]
     document_count: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -93,8 +93,8 @@ class DocumentResponse(BaseModel):
     chunk_count: int
     tags: List[str]
     metadata: dict
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -229,6 +229,7 @@ async def process_document(document_id: str, db: Session):
         # Process each chunk
         from qdrant_client.models import PointStruct
         points = []
+        chunk_rows = []
 
         for i, chunk_content in enumerate(chunks):
             chunk_id = str(uuid4())
@@ -236,16 +237,15 @@ async def process_document(document_id: str, db: Session):
             # Get embedding
             embedding = embedding_service.get_embedding(chunk_content)
 
-            # Create chunk record
-            chunk = DocumentChunk(
-                id=chunk_id,
-                document_id=document_id,
-                chunk_index=i,
-                content=chunk_content,
-                token_count=len(chunk_content.split()),
-                embedding_id=chunk_id,
-            )
-            db.add(chunk)
+            # Chunk record, inserted with the rest of the document below
+            chunk_rows.append({
+                "id": chunk_id,
+                "document_id": document_id,
+                "chunk_index": i,
+                "content": chunk_content,
+                "token_count": len(chunk_content.split()),
+                "embedding_id": chunk_id,
+            })
 
             # Prepare point for Qdrant
             points.append(PointStruct(
@@ -270,6 +270,8 @@ async def process_document(document_id: str, db: Session):
                 points=points
             )
 
+        DocumentChunk.bulk_create(db, chunk_rows)
+
         document.chunk_count = len(chunks)
         document.embedding_status = "completed"
         db.commit()
@@ -311,8 +313,14 @@ async def list_folders(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all folders as a tree structure."""
+    # Document counts come from one selectin query over document ids; any other
+    # relationship access in the tree builder would be an N+1, so it raises
     folders = (
         db.query(Folder)
+        .options(
+            selectinload(Folder.documents).load_only(Document.id),
+            raiseload("*"),
+        )
         .filter(Folder.user_id == current_user.id)
         .all()
     )
@@ -356,8 +364,8 @@ async def create_folder(
         description=folder.description,
         color=folder.color,
         document_count=0,
-        created_at=folder.created_at.isoformat() if folder.created_at else "",
-        updated_at=folder.updated_at.isoformat() if folder.updated_at else "",
+        created_at=folder.created_at,
+        updated_at=folder.updated_at,
     )
 
 
@@ -411,8 +419,8 @@ async def update_folder(
         description=folder.description,
         color=folder.color,
         document_count=doc_count,
-        created_at=folder.created_at.isoformat() if folder.created_at else "",
-        updated_at=folder.updated_at.isoformat() if folder.updated_at else "",
+        created_at=folder.created_at,
+        updated_at=folder.updated_at,
     )
 
 
@@ -456,7 +464,11 @@ async def list_documents(
     current_user: User = Depends(get_current_active_user),
 ):
     """List documents with optional filtering."""
-    query = db.query(Document).filter(Document.user_id == current_user.id)
+    # Parse errors are only shown by the detail/status endpoints (the extracted
+    # text lives in document_contents and is never touched here)
+    query = db.query(Document).options(
+        defer(Document.parse_error)
+    ).filter(Document.user_id == current_user.id)
 
     if folder_id:
         query = query.filter(Document.folder_id == folder_id)
@@ -464,6 +476,11 @@ async def list_documents(
     if search:
         query = query.filter(Document.name.ilike(f"%{search}%"))
 
+    if tags:
+        # Comma-separated, as sent by the upload form; documents must carry every tag
+        for tag in {t.strip() for t in tags.split(",") if t.strip()}:
+            query = query.filter(Document.has_tag(tag))
+
     # Total count
     total = query.count()
 
@@ -471,9 +488,10 @@ async def list_documents(
     offset = (page - 1) * page_size
     documents = query.order_by(Document.updated_at.desc()).offset(offset).limit(page_size).all()
 
-    return DocumentListResponse(
+    # Built from our own DB rows, so skip re-validating every field
+    return DocumentListResponse.model_construct(
         documents=[
-            DocumentResponse(
+            DocumentResponse.model_construct(
                 id=doc.id,
                 name=doc.name,
                 file_type=doc.file_type,
@@ -485,8 +503,8 @@ async def list_documents(
                 chunk_count=doc.chunk_count,
                 tags=doc.tags or [],
                 metadata=doc.doc_metadata or {},
-                created_at=doc.created_at.isoformat() if doc.created_at else "",
-                updated_at=doc.updated_at.isoformat() if doc.updated_at else "",
+                created_at=doc.created_at,
+                updated_at=doc.updated_at,
             )
             for doc in documents
         ],
@@ -571,8 +589,8 @@ async def upload_document(
         chunk_count=document.chunk_count,
         tags=document.tags or [],
         metadata=document.doc_metadata or {},
-        created_at=document.created_at.isoformat() if document.created_at else "",
-        updated_at=document.updated_at.isoformat() if document.updated_at else "",
+        created_at=document.created_at,
+        updated_at=document.updated_at,
     )
 
 
@@ -630,8 +648,8 @@ async def import_url(
         chunk_count=document.chunk_count,
         tags=document.tags or [],
         metadata=document.doc_metadata or {},
-        created_at=document.created_at.isoformat() if document.created_at else "",
-        updated_at=document.updated_at.isoformat() if document.updated_at else "",
+        created_at=document.created_at,
+        updated_at=document.updated_at,
     )
 
 
@@ -662,8 +680,8 @@ async def get_document(
         chunk_count=document.chunk_count,
         tags=document.tags or [],
         metadata=document.doc_metadata or {},
-        created_at=document.created_at.isoformat() if document.created_at else "",
-        updated_at=document.updated_at.isoformat() if document.updated_at else "",
+        created_at=document.created_at,
+        updated_at=document.updated_at,
     )
 
 
@@ -703,8 +721,8 @@ async def update_document(
         chunk_count=document.chunk_count,
         tags=document.tags or [],
         metadata=document.doc_metadata or {},
-        created_at=document.created_at.isoformat() if document.created_at else "",
-        updated_at=document.updated_at.isoformat() if document.updated_at else "",
+        created_at=document.created_at,
+        updated_at=document.updated_at,
     )
 
 
@@ -732,9 +750,14 @@ async def delete_document(
         qdrant_url = getattr(app_settings, 'qdrant_url', 'http://localhost:6333')
         vector_service = VectorService(url=qdrant_url)
 
-        # Get chunk IDs
-        chunks = db.query(DocumentChunk).filter(DocumentChunk.document_id == document_id).all()
-        chunk_ids = [chunk.embedding_id for chunk in chunks if chunk.embedding_id]
+        # Get chunk IDs (only the column, not the chunk text)
+        chunk_ids = [
+            embedding_id
+            for (embedding_id,) in db.query(DocumentChunk.embedding_id).filter(
+                DocumentChunk.document_id == document_id,
+                DocumentChunk.embedding_id.isnot(None),
+            )
+        ]
 
         if chunk_ids:
             vector_service.client.delete(
@@ -751,7 +774,9 @@ async def delete_document(
         except Exception as e:
             logger.warning(f"Failed to delete file: {e}")
 
-    # Delete document (cascades to chunks)
+    # Delete chunks in one statement first, so the ORM cascade does not load
+    # every chunk's content just to delete it row by row
+    db.query(DocumentChunk).filter(DocumentChunk.document_id == document_id).delete()
     db.delete(document)
     db.commit()
 
@@ -797,8 +822,8 @@ async def move_document(
         chunk_count=document.chunk_count,
         tags=document.tags or [],
         metadata=document.doc_metadata or {},
-        created_at=document.created_at.isoformat() if document.created_at else "",
-        updated_at=document.updated_at.isoformat() if document.updated_at else "",
+        created_at=document.created_at,
+        updated_at=document.updated_at,
     )
 
 
@@ -858,22 +883,9 @@ async def get_tags(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all unique tags from user's documents."""
-    documents = (
-        db.query(Document)
-        .filter(Document.user_id == current_user.id)
-        .all()
-    )
-
-    # Aggregate tags
-    tag_counts = {}
-    for doc in documents:
-        if doc.tags:
-            for tag in doc.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-
-    # Sort by count
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+    # Counted in SQL by expanding each tags array; no Document rows are loaded
+    tag_counts = Document.tag_counts(db, current_user.id)
 
     return TagsResponse(
-        tags=[TagItem(name=name, count=count) for name, count in sorted_tags]
+        tags=[TagItem(name=name, count=count) for name, count in tag_counts]
     )
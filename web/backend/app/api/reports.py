@@ -419,9 +419,10 @@ async def list_reports(
     total = query.count()
     reports = query.offset((page - 1) * page_size).limit(page_size).all()
 
-    return ReportListResponse(
+    # Built from our own DB rows, so skip re-validating every field
+    return ReportListResponse.model_construct(
         reports=[
-            ReportResponse(
+            ReportResponse.model_construct(
                 id=r.id,
                 title=r.title,
                 template_type=r.template_type,
@@ -10,24 +10,31 @@ Provides endpoints for:
 """
 
 import asyncio
-import json
+import time
 import uuid
 import sys
-from datetime import datetime
-from typing import Optional, List, AsyncGenerator
-
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, List, AsyncGenerator, Mapping
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.orm import Session, defer, load_only
 
 from app.db.database import get_db
 from app.db.models import (
     User, UserSettings, ResearchSession, AgentProfile,
-    AgentExecution, ResearchTask
+    AgentExecution, ResearchTask, utcnow
 )
 from app.auth.deps import get_current_active_user
 from app.auth.security import decrypt_api_key
+from app.api.agent_profiles import DEFAULT_AGENTS_BY_TYPE, model_provider, provider_key_name
 
 router = APIRouter()
 
@@ -54,6 +61,15 @@ AGENT_CAPABILITIES = {
 }
 
 
+SYNTHESIS_INSTRUCTIONS = """请综合用户提供的研究结果（JSON 格式），生成一份完整的研究报告。
+
+请按以下结构组织：
+# 研究概述
+# 主要发现
+# 关键洞察
+# 结论与建议"""
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -94,6 +110,8 @@ class SessionDetailResponse(SessionResponse):
 class SessionListResponse(BaseModel):
     sessions: List[SessionResponse]
     total: int
+    page: int = 1
+    page_size: int = 50
 
 
 class TaskResponse(BaseModel):
@@ -114,6 +132,8 @@ class TaskResponse(BaseModel):
 class TaskListResponse(BaseModel):
     tasks: List[TaskResponse]
     total: int
+    page: int = 1
+    page_size: int = 50
 
 
 class ExecutionResponse(BaseModel):
@@ -135,6 +155,8 @@ class ExecutionResponse(BaseModel):
 class ExecutionListResponse(BaseModel):
     executions: List[ExecutionResponse]
     total: int
+    page: int = 1
+    page_size: int = 50
 
 
 class MemoryResponse(BaseModel):
@@ -150,77 +172,151 @@ class ExecuteRequest(BaseModel):
 # Helper Functions
 # =============================================================================
 
-def get_user_api_keys(user: User, db: Session) -> dict[str, str]:
-    """Get decrypted API keys for a user."""
-    settings = db.query(UserSettings).filter(UserSettings.user_id == user.id).first()
-    if not settings:
-        return {}
+_API_KEY_COLUMNS = {
+    "openai": UserSettings.openai_api_key,
+    "anthropic": UserSettings.anthropic_api_key,
+    "google": UserSettings.google_api_key,
+}
+
+
+def get_user_api_keys(user: User, db: Session) -> Mapping[str, str]:
+    """Get decrypted API keys for a user.
+
+    The mapping is read-only: one instance is shared by every agent task of a
+    streaming execution, so no task can alter the keys another one sees.
+    """
+    # Only the key columns, not the whole settings row
+    row = db.execute(
+        select(*_API_KEY_COLUMNS.values()).where(UserSettings.user_id == user.id)
+    ).one_or_none()
+    if not row:
+        return MappingProxyType({})
+
+    return MappingProxyType({
+        provider: decrypt_api_key(value)
+        for provider, value in zip(_API_KEY_COLUMNS, row)
+        if value
+    })
+
+
+def get_request_api_keys(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Mapping[str, str]:
+    """Dependency: the user's decrypted API keys, resolved once per request.
+
+    FastAPI caches dependency results for the lifetime of a request, so every
+    consumer in the request (including the streaming executor) shares one dict.
+    """
+    return get_user_api_keys(current_user, db)
+
+
+def get_owned_session(
+    session_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> ResearchSession:
+    """Dependency: the current user's research session from the path, or 404.
+
+    The messages log is never returned by the session endpoints, so it is
+    deferred and only loaded if something touches it.
+    """
+    session = db.query(ResearchSession).options(defer(ResearchSession.messages)).filter(
+        ResearchSession.id == session_id,
+        ResearchSession.user_id == current_user.id
+    ).first()
+
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
 
-    keys = {}
-    if settings.openai_api_key:
-        keys["openai"] = decrypt_api_key(settings.openai_api_key)
-    if settings.anthropic_api_key:
-        keys["anthropic"] = decrypt_api_key(settings.anthropic_api_key)
-    if settings.google_api_key:
-        keys["google"] = decrypt_api_key(settings.google_api_key)
+    return session
 
-    return keys
+
+# The profile fields the executor reads, detached from the ORM
+AgentProfileLite = namedtuple(
+    "AgentProfileLite", "id display_name persona temperature max_tokens role_model"
+)
+
+# The task fields the executor reads, snapshotted before its first commit
+# expires the ORM rows
+TaskLite = namedtuple(
+    "TaskLite", "id description assigned_agent execution_group execution_order"
+)
+
+# Enabled agent profiles per user, cached across requests for execute_research.
+# Entries are keyed on (user_id, profile count, latest updated_at), so any
+# create/update/delete of the user's profiles produces a new key; the TTL only
+# bounds staleness from writes that bypass the ORM. Values hold AgentProfileLite
+# tuples, never ORM instances, so they outlive the session that loaded them.
+_PROFILE_CACHE: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+_PROFILE_CACHE_TTL = 60.0
+_PROFILE_CACHE_SIZE = 1024
+
+_PROFILE_LITE_COLUMNS = tuple(getattr(AgentProfile, name) for name in AgentProfileLite._fields)
+
+
+def get_user_agent_profiles(user_id: str, db: Session) -> dict[str, AgentProfileLite]:
+    """Return the user's enabled agent profiles as {agent_type: AgentProfileLite}."""
+    version = db.execute(
+        select(func.count(AgentProfile.id), func.max(AgentProfile.updated_at))
+        .where(AgentProfile.user_id == user_id)
+    ).one()
+    key = (user_id, *version)
+    now = time.monotonic()
+
+    cached = _PROFILE_CACHE.get(key)
+    if cached and now - cached[0] < _PROFILE_CACHE_TTL:
+        _PROFILE_CACHE.move_to_end(key)
+        return cached[1]
+
+    rows = db.execute(
+        select(AgentProfile.agent_type, *_PROFILE_LITE_COLUMNS).where(
+            AgentProfile.user_id == user_id,
+            AgentProfile.is_enabled == True
+        )
+    ).all()
+    profiles = {agent_type: AgentProfileLite._make(fields) for agent_type, *fields in rows}
+
+    _PROFILE_CACHE[key] = (now, profiles)
+    _PROFILE_CACHE.move_to_end(key)
+    while len(_PROFILE_CACHE) > _PROFILE_CACHE_SIZE:
+        _PROFILE_CACHE.popitem(last=False)
+    return profiles
+
+
+# (agent_type, keywords) in assignment priority order, built once at import
+_AGENT_KEYWORDS = (
+    ("explorer", ("文献", "论文", "检索", "survey", "paper", "literature")),
+    ("genealogist", ("人物", "作者", "师承", "谱系", "who", "lineage")),
+    ("historian", ("演进", "历史", "起源", "timeline", "evolution", "history")),
+    ("logician", ("证明", "推理", "数学", "逻辑", "proof", "logic")),
+    ("critic", ("批判", "审查", "问题", "critique", "review")),
+    ("connector", ("跨领域", "联系", "类比", "cross", "connect")),
+    ("builder", ("代码", "实现", "实验", "code", "implement")),
+    ("scribe", ("写作", "报告", "文档", "write", "report")),
+    ("social_scout", ("社交", "twitter", "热点", "social")),
+    ("cn_specialist", ("中文", "国内", "chinese")),
+    ("vision_analyst", ("图", "图表", "架构", "visual", "chart")),
+)
 
 
 def assign_agent_for_task(task_description: str) -> str:
     """Simple rule-based agent assignment based on task keywords."""
     task_lower = task_description.lower()
 
-    # Keyword-based assignment
-    if any(kw in task_lower for kw in ["文献", "论文", "检索", "survey", "paper", "literature"]):
-        return "explorer"
-    if any(kw in task_lower for kw in ["人物", "作者", "师承", "谱系", "who", "lineage"]):
-        return "genealogist"
-    if any(kw in task_lower for kw in ["演进", "历史", "起源", "timeline", "evolution", "history"]):
-        return "historian"
-    if any(kw in task_lower for kw in ["证明", "推理", "数学", "逻辑", "proof", "logic"]):
-        return "logician"
-    if any(kw in task_lower for kw in ["批判", "审查", "问题", "critique", "review"]):
-        return "critic"
-    if any(kw in task_lower for kw in ["跨领域", "联系", "类比", "cross", "connect"]):
-        return "connector"
-    if any(kw in task_lower for kw in ["代码", "实现", "实验", "code", "implement"]):
-        return "builder"
-    if any(kw in task_lower for kw in ["写作", "报告", "文档", "write", "report"]):
-        return "scribe"
-    if any(kw in task_lower for kw in ["社交", "twitter", "热点", "social"]):
-        return "social_scout"
-    if any(kw in task_lower for kw in ["中文", "国内", "chinese"]):
-        return "cn_specialist"
-    if any(kw in task_lower for kw in ["图", "图表", "架构", "visual", "chart"]):
-        return "vision_analyst"
+    # Keyword-based assignment: first agent (in priority order) with a matching keyword
+    for agent_type, keywords in _AGENT_KEYWORDS:
+        for kw in keywords:
+            if kw in task_lower:
+                return agent_type
 
     # Default to explorer for general research tasks
     return "explorer"
 
 
-async def decompose_task_with_llm(
-    task: str,
-    api_keys: dict,
-    max_subtasks: int = 5
-) -> List[dict]:
-    """Use LLM to decompose a research task into subtasks."""
-    import litellm
-
-    # Determine model
-    if api_keys.get("openai"):
-        model = "openai/gpt-4o"
-        api_key = api_keys["openai"]
-    elif api_keys.get("anthropic"):
-        model = "anthropic/claude-3-5-sonnet-20241022"
-        api_key = api_keys["anthropic"]
-    elif api_keys.get("google"):
-        model = "google/gemini-2.0-pro"
-        api_key = api_keys["google"]
-    else:
-        raise ValueError("No API key available")
+_DECOMPOSE_AGENTS = ("explorer", "logician", "critic", "connector", "genealogist", "historian", "builder", "scribe")
 
-    system_prompt = """你是一个研究任务分解专家。请将用户的研究任务分解为具体的子任务。
+_DECOMPOSE_SYSTEM_PROMPT = """你是一个研究任务分解专家。请将用户的研究任务分解为具体的子任务。
 
 每个子任务应该：
 1. 可以独立执行
@@ -249,21 +345,95 @@ async def decompose_task_with_llm(
   ]
 }"""
 
+
+_SUBTASK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "subtasks": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "description": {"type": "string"},
+                    "assigned_agent": {"type": "string", "enum": list(_DECOMPOSE_AGENTS)},
+                    "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+                    "execution_group": {"type": "integer"},
+                },
+                "required": ["description", "assigned_agent", "priority", "execution_group"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["subtasks"],
+    "additionalProperties": False,
+}
+
+_DECOMPOSE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "Subtasks", "schema": _SUBTASK_SCHEMA, "strict": True},
+}
+
+
+def parse_json_object(text: str) -> dict:
+    """Parse a JSON object from model output, tolerating text around it."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # e.g. ```json fences or a sentence before/after the object
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return orjson.loads(text[start:end + 1])
+
+
+# (api key name, model) tried in order when no model-specific key is available
+_PROVIDER_FALLBACKS = (
+    ("openai", "openai/gpt-4o"),
+    ("anthropic", "anthropic/claude-3-5-sonnet-20241022"),
+    ("google", "google/gemini-2.0-pro"),
+)
+
+
+def fallback_model(api_keys: Mapping[str, str]) -> tuple[str, str]:
+    """Return (model, api_key) for the first fallback provider with a key."""
+    for key_name, model in _PROVIDER_FALLBACKS:
+        if api_keys.get(key_name):
+            return model, api_keys[key_name]
+    raise ValueError("No API key available")
+
+
+async def decompose_task_with_llm(
+    task: str,
+    api_keys: Mapping[str, str],
+    max_subtasks: int = 5
+) -> List[dict]:
+    """Use LLM to decompose a research task into subtasks."""
+    import litellm
+
+    # Determine model
+    model, api_key = fallback_model(api_keys)
+
+    # Strict schema-guided decoding where supported, plain JSON mode elsewhere
+    if model_provider(model) == "openai":
+        response_format = _DECOMPOSE_RESPONSE_FORMAT
+    else:
+        response_format = {"type": "json_object"}
+
     try:
         response = await litellm.acompletion(
             model=model,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _DECOMPOSE_SYSTEM_PROMPT},
                 {"role": "user", "content": f"请分解以下研究任务（最多{max_subtasks}个子任务）：\n\n{task}"}
             ],
             max_tokens=2000,
             temperature=0.3,
             api_key=api_key,
-            response_format={"type": "json_object"},
+            response_format=response_format,
         )
 
         result_text = response.choices[0].message.content
-        result = json.loads(result_text)
+        result = parse_json_object(result_text)
 
         subtasks = result.get("subtasks", [])[:max_subtasks]
 
@@ -292,15 +462,31 @@ async def decompose_task_with_llm(
         }]
 
 
-async def execute_agent_task(
-    task_description: str,
-    agent_type: str,
-    agent_profile: Optional[AgentProfile],
-    api_keys: dict,
-) -> dict:
-    """Execute a task with a specific agent."""
-    import litellm
+def build_system_message(model: str, persona: str, instructions: Optional[str] = None) -> dict:
+    """
+    Build the system message as a stable, cacheable prefix.
+
+    The persona (plus any fixed instructions) always comes first and is
+    byte-identical across calls, so OpenAI's automatic prefix caching applies;
+    Anthropic models additionally get an explicit ephemeral cache breakpoint.
+    """
+    if model_provider(model) in ("anthropic", "claude"):
+        blocks = [{"type": "text", "text": persona}]
+        if instructions:
+            blocks.append({"type": "text", "text": instructions})
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+        return {"role": "system", "content": blocks}
+
+    content = f"{persona}\n\n{instructions}" if instructions else persona
+    return {"role": "system", "content": content}
+
 
+def resolve_agent_config(
+    agent_type: str,
+    agent_profile: Optional[AgentProfileLite],
+    api_keys: Mapping[str, str],
+) -> tuple[str, float, int, str, str]:
+    """Resolve (persona, temperature, max_tokens, model, api_key) for an agent."""
     # Get agent configuration
     if agent_profile:
         persona = agent_profile.persona
@@ -309,8 +495,7 @@ async def execute_agent_task(
         model = agent_profile.role_model
     else:
         # Use defaults from agent_profiles.py
-        from app.api.agent_profiles import DEFAULT_AGENTS
-        default = next((a for a in DEFAULT_AGENTS if a["agent_type"] == agent_type), None)
+        default = DEFAULT_AGENTS_BY_TYPE.get(agent_type)
         if default:
             persona = default["persona"]
             temperature = default["temperature"]
@@ -323,26 +508,41 @@ async def execute_agent_task(
             model = "openai/gpt-4o"
 
     # Get API key for model
-    api_key = None
-    if "openai" in model and api_keys.get("openai"):
-        api_key = api_keys["openai"]
-    elif "anthropic" in model and api_keys.get("anthropic"):
-        api_key = api_keys["anthropic"]
-    elif "google" in model and api_keys.get("google"):
-        api_key = api_keys["google"]
-    elif api_keys.get("openai"):
-        model = "openai/gpt-4o"
-        api_key = api_keys["openai"]
-    else:
-        raise ValueError("No suitable API key")
+    key_name = provider_key_name(model)
+    api_key = api_keys.get(key_name) if key_name else None
+    if not api_key:
+        model, api_key = fallback_model(api_keys)
+
+    return persona, temperature, max_tokens, model, api_key
+
+
+async def execute_agent_task(
+    task_description: str,
+    agent_type: str,
+    agent_profile: Optional[AgentProfileLite],
+    api_keys: Mapping[str, str],
+    instructions: Optional[str] = None,
+) -> dict:
+    """Execute a task with a specific agent.
+
+    Fixed ``instructions`` are sent with the persona in the system message so
+    they are part of the cached prompt prefix; ``task_description`` is the
+    variable suffix.
+    """
+    import litellm
+
+    persona, temperature, max_tokens, model, api_key = resolve_agent_config(
+        agent_type, agent_profile, api_keys
+    )
 
-    start_time = datetime.utcnow()
+    # Monotonic clock for the duration; wall-clock timestamps are taken by the caller
+    t0 = time.perf_counter_ns()
 
     try:
         response = await litellm.acompletion(
             model=model,
             messages=[
-                {"role": "system", "content": persona},
+                build_system_message(model, persona, instructions),
                 {"role": "user", "content": task_description}
             ],
             max_tokens=max_tokens,
@@ -350,8 +550,7 @@ async def execute_agent_task(
             api_key=api_key,
         )
 
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
 
         result = response.choices[0].message.content
         tokens_used = response.usage.total_tokens if response.usage else 0
@@ -366,8 +565,7 @@ async def execute_agent_task(
         }
 
     except Exception as e:
-        end_time = datetime.utcnow()
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
 
         return {
             "status": "failed",
@@ -379,156 +577,305 @@ async def execute_agent_task(
         }
 
 
+async def stream_agent_task(
+    task_description: str,
+    agent_type: str,
+    agent_profile: Optional[AgentProfileLite],
+    api_keys: Mapping[str, str],
+    instructions: Optional[str] = None,
+) -> AsyncGenerator[str, None]:
+    """Like execute_agent_task, but yield the output text as it is generated."""
+    import litellm
+
+    persona, temperature, max_tokens, model, api_key = resolve_agent_config(
+        agent_type, agent_profile, api_keys
+    )
+
+    response = await litellm.acompletion(
+        model=model,
+        messages=[
+            build_system_message(model, persona, instructions),
+            {"role": "user", "content": task_description}
+        ],
+        max_tokens=max_tokens,
+        temperature=temperature,
+        api_key=api_key,
+        stream=True,
+    )
+    async for chunk in response:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
+
+
+def _sse(event: dict) -> bytes:
+    """Format one server-sent event frame."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+async def run_research_task(
+    task: TaskLite,
+    agent_profile: Optional[AgentProfileLite],
+    api_keys: Mapping[str, str],
+    semaphore: asyncio.Semaphore,
+) -> tuple:
+    """Run one research task under the concurrency limit.
+
+    Takes detached snapshots only, so it never touches the DB session (not even
+    through a lazy load of an expired ORM attribute).
+    """
+    async with semaphore:
+        started_at = utcnow()
+        result = await execute_agent_task(
+            task_description=task.description,
+            agent_type=task.assigned_agent,
+            agent_profile=agent_profile,
+            api_keys=api_keys,
+        )
+    return task, agent_profile, started_at, result
+
+
 async def stream_research_execution(
     session: ResearchSession,
     tasks: List[ResearchTask],
-    agent_profiles: dict,
-    api_keys: dict,
+    agent_profiles: dict[str, AgentProfileLite],
+    api_keys: Mapping[str, str],
     db: Session,
-) -> AsyncGenerator[str, None]:
+    max_agents: int = 5,
+) -> AsyncGenerator[bytes, None]:
     """Execute research tasks and stream progress."""
+    semaphore = asyncio.Semaphore(max_agents)
+
+    # Plain snapshots of what the executor reads: the per-group commits below
+    # expire the ORM rows, and reading them again would re-select each one
+    session_id = session.id
+    snapshots = [
+        TaskLite(t.id, t.description, t.assigned_agent, t.execution_group, t.execution_order)
+        for t in tasks
+    ]
 
-    yield f"data: {json.dumps({'type': 'started', 'message': '研究开始', 'total_tasks': len(tasks)})}\n\n"
+    yield _sse({'type': 'started', 'message': '研究开始', 'total_tasks': len(tasks)})
 
-    # Group tasks by execution_group for parallel execution
-    groups = {}
-    for task in tasks:
-        group = task.execution_group
-        if group not in groups:
-            groups[group] = []
-        groups[group].append(task)
+    # Group tasks by execution_group for parallel execution: one sort, then
+    # consecutive runs of the same group
+    tasks_sorted = sorted(snapshots, key=attrgetter("execution_group", "execution_order"))
 
     completed_tasks = 0
-    all_results = []
+    # Per-task result summaries, serialized once as they arrive
+    all_results: List[bytes] = []
 
     # Execute groups in order
-    for group_num in sorted(groups.keys()):
-        group_tasks = groups[group_num]
+    for group_num, group_iter in groupby(tasks_sorted, key=attrgetter("execution_group")):
+        group_tasks = list(group_iter)
 
-        yield f"data: {json.dumps({'type': 'group_started', 'group': group_num, 'tasks': len(group_tasks)})}\n\n"
+        yield _sse({'type': 'group_started', 'group': group_num, 'tasks': len(group_tasks)})
 
-        # Execute all tasks in group sequentially
+        # Tasks in a group are independent: run them concurrently, at most
+        # max_agents LLM calls at a time. Only this generator touches the DB.
+        # Status writes are bulk UPDATEs by primary key, so the expired ORM
+        # rows are never loaded back.
         for task in group_tasks:
-            # Notify task started
-            yield f"data: {json.dumps({'type': 'task_started', 'task_id': task.id, 'agent': task.assigned_agent, 'description': task.description})}\n\n"
-
-            # Update task status
-            task.status = "in_progress"
-            db.commit()
-
-            # Get agent profile if exists
-            agent_profile = agent_profiles.get(task.assigned_agent)
-
-            # Execute
-            result = await execute_agent_task(
-                task_description=task.description,
-                agent_type=task.assigned_agent,
-                agent_profile=agent_profile,
-                api_keys=api_keys,
+            yield _sse({'type': 'task_started', 'task_id': task.id, 'agent': task.assigned_agent, 'description': task.description})
+        db.execute(update(ResearchTask), [
+            {"id": task.id, "status": "in_progress"} for task in group_tasks
+        ])
+        db.commit()
+
+        running = [
+            asyncio.create_task(
+                run_research_task(task, agent_profiles.get(task.assigned_agent), api_keys, semaphore)
             )
+            for task in group_tasks
+        ]
+        task_updates = {}
+        group_executions = []
+        try:
+            for next_done in asyncio.as_completed(running):
+                task, agent_profile, started_at, result = await next_done
+
+                # Execution record, inserted with the rest of the group below
+                group_executions.append({
+                    "session_id": session_id,
+                    "agent_profile_id": agent_profile.id if agent_profile else None,
+                    "research_task_id": task.id,
+                    "agent_type": task.assigned_agent,
+                    "agent_name": agent_profile.display_name if agent_profile else task.assigned_agent,
+                    "task_description": task.description,
+                    "status": result["status"],
+                    "output_result": result["output_result"],
+                    "tokens_used": result["tokens_used"],
+                    "duration_ms": result["duration_ms"],
+                    "model_used": result["model_used"],
+                    "error_message": result["error_message"],
+                    "started_at": started_at,
+                    "completed_at": (
+                        started_at + timedelta(milliseconds=result["duration_ms"])
+                        if result["status"] == "completed" else None
+                    ),
+                })
 
-            # Create execution record
-            execution = AgentExecution(
-                session_id=session.id,
-                agent_profile_id=agent_profile.id if agent_profile else None,
-                research_task_id=task.id,
-                agent_type=task.assigned_agent,
-                agent_name=agent_profile.display_name if agent_profile else task.assigned_agent,
-                task_description=task.description,
-                status=result["status"],
-                output_result=result["output_result"],
-                tokens_used=result["tokens_used"],
-                duration_ms=result["duration_ms"],
-                model_used=result["model_used"],
-                error_message=result["error_message"],
-                started_at=datetime.utcnow(),
-                completed_at=datetime.utcnow() if result["status"] == "completed" else None,
-            )
-            db.add(execution)
-
-            # Update task
-            task.status = result["status"]
-            task.output = result["output_result"]
+                # Update task
+                task_updates[task.id] = {
+                    "id": task.id, "status": result["status"], "output": result["output_result"],
+                }
+
+                completed_tasks += 1
+
+                # Notify task completed
+                yield _sse({'type': 'task_completed', 'task_id': task.id, 'agent': task.assigned_agent, 'status': result['status'], 'tokens': result['tokens_used'], 'progress': completed_tasks / len(tasks)})
+
+                if result["output_result"]:
+                    all_results.append(orjson.dumps({
+                        "agent": task.assigned_agent,
+                        "task": task.description,
+                        "result": result["output_result"][:500] + "..." if len(result["output_result"]) > 500 else result["output_result"]
+                    }))
+        finally:
+            # If the client disconnected mid-group, stop the agents still
+            # running instead of letting them spend tokens on dropped results,
+            # and put their tasks back to pending so a later execute picks
+            # them up again
+            unfinished = [t for t in running if not t.done()]
+            for agent_run in unfinished:
+                agent_run.cancel()
+            for task in group_tasks:
+                task_updates.setdefault(task.id, {"id": task.id, "status": "pending"})
+
+            # One multi-row INSERT per group, committed with the task updates.
+            # This must happen before the first await: after a disconnect the
+            # response's cancel scope cancels every await in here, so anything
+            # after it would never run.
+            db.execute(update(ResearchTask), list(task_updates.values()))
+            if group_executions:
+                db.execute(insert(AgentExecution), group_executions)
             db.commit()
 
-            completed_tasks += 1
-
-            # Notify task completed
-            yield f"data: {json.dumps({'type': 'task_completed', 'task_id': task.id, 'agent': task.assigned_agent, 'status': result['status'], 'tokens': result['tokens_used'], 'progress': completed_tasks / len(tasks)})}\n\n"
-
-            if result["output_result"]:
-                all_results.append({
-                    "agent": task.assigned_agent,
-                    "task": task.description,
-                    "result": result["output_result"][:500] + "..." if len(result["output_result"]) > 500 else result["output_result"]
-                })
+            await asyncio.gather(*unfinished, return_exceptions=True)
 
     # Synthesis phase
-    yield f"data: {json.dumps({'type': 'synthesis_started', 'message': '正在综合研究结果...'})}\n\n"
+    yield _sse({'type': 'synthesis_started', 'message': '正在综合研究结果...'})
 
-    # Simple synthesis - combine all results
-    synthesis_prompt = f"""请综合以下研究结果，生成一份完整的研究报告：
+    # Simple synthesis - combine all results. The fixed instructions go into
+    # the cached system prefix; only the results vary per session. The report
+    # is forwarded to the client as it is generated.
+    synthesis_parts = []
+    synthesis_error = None
+    try:
+        async for delta in stream_agent_task(
+            task_description=(b"[\n" + b",\n".join(all_results) + b"\n]").decode(),
+            agent_type="scribe",
+            agent_profile=agent_profiles.get("scribe"),
+            api_keys=api_keys,
+            instructions=SYNTHESIS_INSTRUCTIONS,
+        ):
+            synthesis_parts.append(delta)
+            yield _sse({'type': 'synthesis_delta', 'text': delta})
+    except Exception as e:
+        print(f"Synthesis failed: {e}", file=sys.stderr)
+        synthesis_error = str(e)
 
-{json.dumps(all_results, ensure_ascii=False, indent=2)}
+    # Update session with results. The task rows were expired by the group
+    # commits; reload them in one query rather than one SELECT per to_dict()
+    tasks = db.query(ResearchTask).filter(
+        ResearchTask.session_id == session_id
+    ).order_by(ResearchTask.execution_order).all()
 
-请按以下结构组织：
-# 研究概述
-# 主要发现
-# 关键洞察
-# 结论与建议
-"""
+    if synthesis_error is not None:
+        # A stream cut off mid-report is not a synthesis: keep the task
+        # results, but store no report and mark the session failed
+        session.research_results = {
+            "tasks": [t.to_dict() for t in tasks],
+            "synthesis": None,
+            "synthesis_error": synthesis_error,
+            "completed_at": utcnow().isoformat(),
+        }
+        session.status = "failed"
+        db.commit()
 
-    synthesis_result = await execute_agent_task(
-        task_description=synthesis_prompt,
-        agent_type="scribe",
-        agent_profile=agent_profiles.get("scribe"),
-        api_keys=api_keys,
-    )
+        yield _sse({'type': 'synthesis_failed', 'error': f"综合报告生成失败: {synthesis_error}"})
+        return
 
-    # Update session with results
+    synthesis = "".join(synthesis_parts)
     session.research_results = {
         "tasks": [t.to_dict() for t in tasks],
-        "synthesis": synthesis_result.get("output_result", ""),
-        "completed_at": datetime.utcnow().isoformat(),
+        "synthesis": synthesis,
+        "completed_at": utcnow().isoformat(),
     }
     session.status = "completed"
     db.commit()
 
-    yield f"data: {json.dumps({'type': 'synthesis_completed', 'result': synthesis_result.get('output_result', '')[:1000]})}\n\n"
-    yield f"data: {json.dumps({'type': 'completed', 'message': '研究完成'})}\n\n"
+    yield _sse({'type': 'synthesis_completed', 'result': synthesis[:1000]})
+    yield _sse({'type': 'completed', 'message': '研究完成'})
 
 
 # =============================================================================
 # Session Endpoints
 # =============================================================================
+# Responses below are built with model_construct(): every value comes from our
+# own DB rows, so re-running field validation on the way out is wasted work.
+
+# Per-session row counts as correlated subqueries, so listing sessions never
+# loads the task/execution collections just to take their len()
+_TASK_COUNT = (
+    select(func.count(ResearchTask.id))
+    .where(ResearchTask.session_id == ResearchSession.id)
+    .correlate(ResearchSession)
+    .scalar_subquery()
+)
+_EXECUTION_COUNT = (
+    select(func.count(AgentExecution.id))
+    .where(AgentExecution.session_id == ResearchSession.id)
+    .correlate(ResearchSession)
+    .scalar_subquery()
+)
 
 @router.get("/sessions", response_model=SessionListResponse)
 async def list_sessions(
     status: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """List all research sessions for the current user."""
-    query = db.query(ResearchSession).filter(ResearchSession.user_id == current_user.id)
+    # Column tuples only: the messages / research_results JSON blobs are never
+    # part of a list entry, so they are not read or materialized here
+    query = db.query(
+        ResearchSession.id,
+        ResearchSession.user_id,
+        ResearchSession.name,
+        ResearchSession.description,
+        ResearchSession.status,
+        ResearchSession.created_at,
+        ResearchSession.updated_at,
+        _TASK_COUNT.label("task_count"),
+        _EXECUTION_COUNT.label("execution_count"),
+    )
 
+    filters = [ResearchSession.user_id == current_user.id]
     if status:
-        query = query.filter(ResearchSession.status == status)
-
-    sessions = query.order_by(ResearchSession.updated_at.desc()).all()
-
-    return SessionListResponse(
-        sessions=[SessionResponse(
-            id=s.id,
-            user_id=s.user_id,
-            name=s.name,
-            description=s.description,
-            status=s.status,
-            task_count=len(s.research_tasks) if s.research_tasks else 0,
-            execution_count=len(s.agent_executions) if s.agent_executions else 0,
-            created_at=s.created_at,
-            updated_at=s.updated_at,
-        ) for s in sessions],
-        total=len(sessions)
+        filters.append(ResearchSession.status == status)
+
+    total = db.query(func.count(ResearchSession.id)).filter(*filters).scalar()
+    rows = query.filter(*filters).order_by(
+        ResearchSession.updated_at.desc()
+    ).offset((page - 1) * page_size).limit(page_size).all()
+
+    return SessionListResponse.model_construct(
+        sessions=[SessionResponse.model_construct(
+            id=r.id,
+            user_id=r.user_id,
+            name=r.name,
+            description=r.description,
+            status=r.status,
+            task_count=r.task_count,
+            execution_count=r.execution_count,
+            created_at=r.created_at,
+            updated_at=r.updated_at,
+        ) for r in rows],
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
@@ -537,10 +884,9 @@ async def create_session(
     request: SessionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    api_keys: Mapping[str, str] = Depends(get_request_api_keys),
 ):
     """Create a new research session with task decomposition."""
-    # Get API keys
-    api_keys = get_user_api_keys(current_user, db)
     if not api_keys:
         raise HTTPException(status_code=400, detail="请先在设置页面配置 API Keys")
 
@@ -550,7 +896,8 @@ async def create_session(
         name=request.name,
         description=request.description,
         status="active",
-        messages=[{"role": "user", "content": request.task, "timestamp": datetime.utcnow().isoformat()}],
+        messages=[{"role": "user", "content": request.task, "timestamp": utcnow().isoformat()}],
+        message_count=1,
         research_results={"original_task": request.task},
     )
     db.add(session)
@@ -559,25 +906,29 @@ async def create_session(
     # Decompose task
     subtasks = await decompose_task_with_llm(request.task, api_keys)
 
-    # Create research tasks
+    # Create research tasks in a single multi-row INSERT. The LLM may return
+    # no subtasks, and an empty parameter list would run a bare INSERT
     created_tasks = []
-    for st in subtasks:
-        task = ResearchTask(
-            session_id=session.id,
-            description=st["description"],
-            assigned_agent=st["assigned_agent"],
-            priority=st["priority"],
-            execution_group=st["execution_group"],
-            execution_order=st["execution_order"],
-            status="pending",
-        )
-        db.add(task)
-        created_tasks.append(task)
-
-    db.commit()
-    db.refresh(session)
+    if subtasks:
+        created_tasks = db.scalars(
+            insert(ResearchTask).returning(ResearchTask, sort_by_parameter_order=True),
+            [
+                {
+                    "session_id": session.id,
+                    "description": st["description"],
+                    "assigned_agent": st["assigned_agent"],
+                    "priority": st["priority"],
+                    "execution_group": st["execution_group"],
+                    "execution_order": st["execution_order"],
+                    "status": "pending",
+                }
+                for st in subtasks
+            ],
+        ).all()
 
-    return SessionDetailResponse(
+    # Built from the flushed session and the RETURNING rows before commit
+    # expires them, so nothing is re-selected
+    response = SessionDetailResponse.model_construct(
         id=session.id,
         user_id=session.user_id,
         name=session.name,
@@ -591,32 +942,25 @@ async def create_session(
         executions=[],
         research_results=session.research_results or {},
     )
+    db.commit()
+    return response
 
 
 @router.get("/sessions/{session_id}", response_model=SessionDetailResponse)
 async def get_session(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Get session details including tasks and executions."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     tasks = db.query(ResearchTask).filter(
-        ResearchTask.session_id == session_id
+        ResearchTask.session_id == session.id
     ).order_by(ResearchTask.execution_order).all()
 
     executions = db.query(AgentExecution).filter(
-        AgentExecution.session_id == session_id
+        AgentExecution.session_id == session.id
     ).order_by(AgentExecution.created_at).all()
 
-    return SessionDetailResponse(
+    return SessionDetailResponse.model_construct(
         id=session.id,
         user_id=session.user_id,
         name=session.name,
@@ -634,20 +978,11 @@ async def get_session(
 
 @router.put("/sessions/{session_id}", response_model=SessionResponse)
 async def update_session(
-    session_id: str,
     request: SessionUpdate,
+    session: ResearchSession = Depends(get_owned_session),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Update session details."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     if request.name is not None:
         session.name = request.name
     if request.description is not None:
@@ -658,14 +993,18 @@ async def update_session(
     db.commit()
     db.refresh(session)
 
-    return SessionResponse(
+    task_count, execution_count = db.query(_TASK_COUNT, _EXECUTION_COUNT).filter(
+        ResearchSession.id == session.id
+    ).one()
+
+    return SessionResponse.model_construct(
         id=session.id,
         user_id=session.user_id,
         name=session.name,
         description=session.description,
         status=session.status,
-        task_count=len(session.research_tasks) if session.research_tasks else 0,
-        execution_count=len(session.agent_executions) if session.agent_executions else 0,
+        task_count=task_count,
+        execution_count=execution_count,
         created_at=session.created_at,
         updated_at=session.updated_at,
     )
@@ -673,19 +1012,10 @@ async def update_session(
 
 @router.delete("/sessions/{session_id}")
 async def delete_session(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Delete a research session."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     db.delete(session)
     db.commit()
 
@@ -698,28 +1028,19 @@ async def delete_session(
 
 @router.post("/sessions/{session_id}/execute")
 async def execute_research(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
     request: ExecuteRequest = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    api_keys: Mapping[str, str] = Depends(get_request_api_keys),
 ):
     """Execute research tasks with streaming progress updates."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    # Get API keys
-    api_keys = get_user_api_keys(current_user, db)
     if not api_keys:
         raise HTTPException(status_code=400, detail="请先在设置页面配置 API Keys")
 
     # Get tasks
     tasks = db.query(ResearchTask).filter(
-        ResearchTask.session_id == session_id,
+        ResearchTask.session_id == session.id,
         ResearchTask.status == "pending"
     ).order_by(ResearchTask.execution_order).all()
 
@@ -727,40 +1048,33 @@ async def execute_research(
         raise HTTPException(status_code=400, detail="No pending tasks to execute")
 
     # Get user's agent profiles
-    profiles = db.query(AgentProfile).filter(
-        AgentProfile.user_id == current_user.id,
-        AgentProfile.is_enabled == True
-    ).all()
-    agent_profiles = {p.agent_type: p for p in profiles}
+    agent_profiles = get_user_agent_profiles(current_user.id, db)
 
     # Return streaming response
     return StreamingResponse(
-        stream_research_execution(session, tasks, agent_profiles, api_keys, db),
+        stream_research_execution(
+            session, tasks, agent_profiles, api_keys, db,
+            max_agents=request.max_agents if request else ExecuteRequest().max_agents,
+        ),
         media_type="text/event-stream",
     )
 
 
 @router.get("/sessions/{session_id}/tasks", response_model=TaskListResponse)
 async def get_session_tasks(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Get all tasks for a session."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
+    total = db.query(func.count(ResearchTask.id)).filter(ResearchTask.session_id == session.id).scalar()
     tasks = db.query(ResearchTask).filter(
-        ResearchTask.session_id == session_id
-    ).order_by(ResearchTask.execution_order).all()
+        ResearchTask.session_id == session.id
+    ).order_by(ResearchTask.execution_order).offset((page - 1) * page_size).limit(page_size).all()
 
-    return TaskListResponse(
-        tasks=[TaskResponse(
+    return TaskListResponse.model_construct(
+        tasks=[TaskResponse.model_construct(
             id=t.id,
             session_id=t.session_id,
             description=t.description,
@@ -774,31 +1088,35 @@ async def get_session_tasks(
             created_at=t.created_at,
             updated_at=t.updated_at,
         ) for t in tasks],
-        total=len(tasks)
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
 @router.get("/sessions/{session_id}/executions", response_model=ExecutionListResponse)
 async def get_session_executions(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Get all agent executions for a session."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    executions = db.query(AgentExecution).filter(
-        AgentExecution.session_id == session_id
-    ).order_by(AgentExecution.created_at).all()
-
-    return ExecutionListResponse(
-        executions=[ExecutionResponse(
+    total = db.query(func.count(AgentExecution.id)).filter(AgentExecution.session_id == session.id).scalar()
+    # Only the columns ExecutionResponse needs; input_context and
+    # error_message can be large and are not part of the listing
+    executions = db.query(AgentExecution).options(load_only(
+        AgentExecution.id, AgentExecution.session_id, AgentExecution.agent_type,
+        AgentExecution.agent_name, AgentExecution.task_description, AgentExecution.status,
+        AgentExecution.output_result, AgentExecution.structured_output,
+        AgentExecution.tokens_used, AgentExecution.duration_ms, AgentExecution.model_used,
+        AgentExecution.started_at, AgentExecution.completed_at,
+    )).filter(
+        AgentExecution.session_id == session.id
+    ).order_by(AgentExecution.created_at).offset((page - 1) * page_size).limit(page_size).all()
+
+    return ExecutionListResponse.model_construct(
+        executions=[ExecutionResponse.model_construct(
             id=e.id,
             session_id=e.session_id,
             agent_type=e.agent_type,
@@ -813,26 +1131,19 @@ async def get_session_executions(
             started_at=e.started_at,
             completed_at=e.completed_at,
         ) for e in executions],
-        total=len(executions)
+        total=total,
+        page=page,
+        page_size=page_size,
     )
 
 
 @router.get("/sessions/{session_id}/memory")
 async def get_session_memory(
-    session_id: str,
+    session: ResearchSession = Depends(get_owned_session),
     layer: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
 ):
     """Get memory contents for a session (L0/L1/L2)."""
-    session = db.query(ResearchSession).filter(
-        ResearchSession.id == session_id,
-        ResearchSession.user_id == current_user.id
-    ).first()
-
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
     # For now, return session's research_results as L2 insights
     # In full implementation, this would read from file-based memory system
     memory = {
@@ -842,8 +1153,13 @@ async def get_session_memory(
     }
 
     # Get execution outputs as L0 raw data
-    executions = db.query(AgentExecution).filter(
-        AgentExecution.session_id == session_id
+    executions = db.query(
+        AgentExecution.agent_type,
+        AgentExecution.task_description,
+        AgentExecution.output_result,
+        AgentExecution.created_at,
+    ).filter(
+        AgentExecution.session_id == session.id
     ).all()
 
     for e in executions:
@@ -875,6 +1191,7 @@ async def create_research_task_legacy(
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    api_keys: Mapping[str, str] = Depends(get_request_api_keys),
 ):
     """Legacy endpoint for simple research tasks."""
     task_text = request.get("task") or request.get("query") or ""
@@ -882,10 +1199,9 @@ async def create_research_task_legacy(
     if not task_text:
         raise HTTPException(status_code=400, detail="Task description required")
 
-    # Create session using new endpoint
-    session_request = SessionCreate(
-        name=task_text[:50] + "..." if len(task_text) > 50 else task_text,
-        task=task_text,
-    )
+    # Create session using new endpoint; task_text is already known to be
+    # non-empty, so SessionCreate's validation has nothing left to check
+    name = task_text[:50] + "..." if len(task_text) > 50 else task_text
+    session_request = SessionCreate.model_construct(name=name, description=None, task=task_text)
 
-    return await create_session(session_request, db, current_user)
+    return await create_session(session_request, db, current_user, api_keys)
@@ -11,7 +11,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.db.models import User, InstalledTool
+from app.db.models import User, InstalledTool, insert_if_absent
 from app.api.auth import get_current_active_user
 
 router = APIRouter()
@@ -343,34 +343,27 @@ async def install_tool(
     if not catalog_tool:
         raise HTTPException(status_code=404, detail="Tool not found in catalog")
 
-    # Check if already installed
-    existing = db.query(InstalledTool).filter(
-        InstalledTool.user_id == current_user.id,
-        InstalledTool.tool_id == request.tool_id,
-    ).first()
-
-    if existing:
-        raise HTTPException(status_code=400, detail="Tool already installed")
-
     # Merge default config with user config
     default_config = {k: v.get("default") for k, v in catalog_tool["config_schema"].items()}
     config = {**default_config, **(request.config or {})}
 
-    # Create installation record
-    installed_tool = InstalledTool(
-        id=str(uuid4()),
-        user_id=current_user.id,
-        tool_id=request.tool_id,
-        tool_name=catalog_tool["name"],
-        tool_version=catalog_tool["version"],
-        is_enabled=True,
-        config=config,
-    )
-    db.add(installed_tool)
-    db.commit()
-    db.refresh(installed_tool)
-
-    return InstalledToolResponse(
+    # Create installation record; the (user_id, tool_id) unique index turns a
+    # repeat install into a no-op, so no existence check is needed first
+    installed_tool = insert_if_absent(db, InstalledTool, {
+        "id": str(uuid4()),
+        "user_id": current_user.id,
+        "tool_id": request.tool_id,
+        "tool_name": catalog_tool["name"],
+        "tool_version": catalog_tool["version"],
+        "is_enabled": True,
+        "config": config,
+    }, ["user_id", "tool_id"])
+
+    if installed_tool is None:
+        raise HTTPException(status_code=409, detail="Tool already installed")
+
+    # Built from the RETURNING row before commit expires it
+    response = InstalledToolResponse(
         id=installed_tool.id,
         tool_id=installed_tool.tool_id,
         tool_name=installed_tool.tool_name,
@@ -386,6 +379,8 @@ async def install_tool(
         icon=catalog_tool["icon"],
         config_schema=catalog_tool["config_schema"],
     )
+    db.commit()
+    return response
 
 
 @router.delete("/installed/{tool_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -418,7 +413,18 @@ async def list_installed_tools(
     current_user: User = Depends(get_current_active_user),
 ):
     """List user's installed tools."""
-    query = db.query(InstalledTool).filter(InstalledTool.user_id == current_user.id)
+    # Column tuples only; no ORM objects are needed to build the list
+    query = db.query(
+        InstalledTool.id,
+        InstalledTool.tool_id,
+        InstalledTool.tool_name,
+        InstalledTool.tool_version,
+        InstalledTool.is_enabled,
+        InstalledTool.config,
+        InstalledTool.usage_count,
+        InstalledTool.last_used_at,
+        InstalledTool.installed_at,
+    ).filter(InstalledTool.user_id == current_user.id)
 
     if enabled_only:
         query = query.filter(InstalledTool.is_enabled == True)
@@ -428,10 +434,11 @@ async def list_installed_tools(
     # Merge with catalog data
     catalog_map = {t["tool_id"]: t for t in TOOL_CATALOG}
 
+    # Built from our own DB rows and catalog, so skip re-validating every field
     result = []
     for tool in installed:
         catalog_tool = catalog_map.get(tool.tool_id, {})
-        result.append(InstalledToolResponse(
+        result.append(InstalledToolResponse.model_construct(
             id=tool.id,
             tool_id=tool.tool_id,
             tool_name=tool.tool_name,
@@ -448,7 +455,7 @@ async def list_installed_tools(
             config_schema=catalog_tool.get("config_schema", {}),
         ))
 
-    return InstalledToolListResponse(tools=result, total=len(result))
+    return InstalledToolListResponse.model_construct(tools=result, total=len(result))
 
 
 @router.get("/installed/{tool_id}", response_model=InstalledToolResponse)
@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session, joinedload
 
 from app.db.database import get_db
-from app.db.models import User, Team, TeamMember, TeamTask
+from app.db.models import User, Team, TeamMember, TeamTask, generate_uuid, insert_if_absent
 from app.auth.deps import get_current_active_user
 
 router = APIRouter()
@@ -122,6 +122,23 @@ class TaskListResponse(BaseModel):
 # Helper Functions
 # =============================================================================
 
+# TaskResponse columns, selected as tuples by the task list endpoints
+_TASK_COLUMNS = (
+    TeamTask.id,
+    TeamTask.team_id,
+    TeamTask.title,
+    TeamTask.description,
+    TeamTask.status,
+    TeamTask.priority,
+    TeamTask.due_date,
+    TeamTask.completed_at,
+    TeamTask.assignee_id,
+    TeamTask.created_by_id,
+    TeamTask.created_at,
+    TeamTask.updated_at,
+)
+
+
 def get_team_or_404(team_id: str, user_id: str, db: Session) -> Team:
     """Get team and verify user is a member."""
     team = db.query(Team).filter(Team.id == team_id).first()
@@ -163,18 +180,24 @@ async def list_teams(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all teams the user is a member of."""
-    # Get team IDs where user is a member
-    memberships = db.query(TeamMember).filter(
+    # One join over the user's memberships, selecting column tuples only
+    rows = db.query(
+        Team.id,
+        Team.owner_id,
+        Team.name,
+        Team.description,
+        Team.avatar_url,
+        Team.member_count,
+        Team.created_at,
+        Team.updated_at,
+    ).join(TeamMember, TeamMember.team_id == Team.id).filter(
         TeamMember.user_id == current_user.id
-    ).all()
-
-    team_ids = [m.team_id for m in memberships]
+    ).order_by(Team.created_at.desc()).all()
 
-    teams = db.query(Team).filter(Team.id.in_(team_ids)).order_by(Team.created_at.desc()).all()
-
-    return TeamListResponse(
-        teams=[TeamResponse.model_validate(t) for t in teams],
-        total=len(teams)
+    # Built from our own DB rows, so skip re-validating every field
+    return TeamListResponse.model_construct(
+        teams=[TeamResponse.model_construct(**row._mapping) for row in rows],
+        total=len(rows),
     )
 
 
@@ -341,35 +364,33 @@ async def add_member(
     if not user:
         raise HTTPException(status_code=404, detail="User not found with this email")
 
-    # Check if already a member
-    existing = db.query(TeamMember).filter(
-        TeamMember.team_id == team_id,
-        TeamMember.user_id == user.id
-    ).first()
-    if existing:
-        raise HTTPException(status_code=400, detail="User is already a member")
-
-    # Add member
-    member = TeamMember(
-        team_id=team_id,
-        user_id=user.id,
-        role=request.role if request.role != "owner" else "member",
-    )
-    db.add(member)
-
-    # Update member count
-    team.member_count += 1
-    db.commit()
-    db.refresh(member)
-
-    return TeamMemberResponse(
+    # Add member; the (team_id, user_id) unique index turns an existing
+    # membership into a no-op, so no existence check is needed first
+    member = insert_if_absent(db, TeamMember, {
+        "id": generate_uuid(),
+        "team_id": team_id,
+        "user_id": user.id,
+        "role": request.role if request.role != "owner" else "member",
+    }, ["team_id", "user_id"])
+    if member is None:
+        raise HTTPException(status_code=409, detail="User is already a member")
+
+    # Update member count in SQL (member_count = member_count + 1) so
+    # concurrent membership changes don't overwrite each other
+    team.member_count = Team.member_count + 1
+
+    # Build the response before commit expires the loaded rows
+    response = TeamMemberResponse(
         id=member.id,
         user_id=user.id,
-        username=user.username,
+        username=user.display_name,
         email=user.email,
         role=member.role,
         joined_at=member.joined_at,
     )
+    db.commit()
+
+    return response
 
 
 @router.put("/teams/{team_id}/members/{user_id}", response_model=TeamMemberResponse)
@@ -450,8 +471,8 @@ async def remove_member(
 
     db.delete(member)
 
-    # Update member count
-    team.member_count -= 1
+    # Update member count in SQL, as in add_member
+    team.member_count = Team.member_count - 1
     db.commit()
 
 
@@ -471,7 +492,10 @@ async def list_tasks(
     """Get team tasks with optional filtering."""
     get_team_or_404(team_id, current_user.id, db)
 
-    query = db.query(TeamTask).filter(TeamTask.team_id == team_id)
+    # Assignee names come from an outer join instead of a lookup per task
+    query = db.query(
+        *_TASK_COLUMNS, User.display_name.label("assignee_name")
+    ).outerjoin(User, User.id == TeamTask.assignee_id).filter(TeamTask.team_id == team_id)
 
     if status:
         query = query.filter(TeamTask.status == status)
@@ -480,34 +504,13 @@ async def list_tasks(
     if priority:
         query = query.filter(TeamTask.priority == priority)
 
-    tasks = query.order_by(TeamTask.created_at.desc()).all()
-
-    # Get assignee names
-    task_responses = []
-    for task in tasks:
-        assignee_name = None
-        if task.assignee_id:
-            assignee = db.query(User).filter(User.id == task.assignee_id).first()
-            if assignee:
-                assignee_name = assignee.username
-
-        task_responses.append(TaskResponse(
-            id=task.id,
-            team_id=task.team_id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            completed_at=task.completed_at,
-            assignee_id=task.assignee_id,
-            assignee_name=assignee_name,
-            created_by_id=task.created_by_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        ))
-
-    return TaskListResponse(tasks=task_responses, total=len(task_responses))
+    rows = query.order_by(TeamTask.created_at.desc()).all()
+
+    # Built from our own DB rows, so skip re-validating every field
+    return TaskListResponse.model_construct(
+        tasks=[TaskResponse.model_construct(**row._mapping) for row in rows],
+        total=len(rows),
+    )
 
 
 @router.post("/teams/{team_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -674,29 +677,18 @@ async def get_my_tasks(
     current_user: User = Depends(get_current_active_user),
 ):
     """Get all tasks assigned to current user across all teams."""
-    query = db.query(TeamTask).filter(TeamTask.assignee_id == current_user.id)
+    query = db.query(*_TASK_COLUMNS).filter(TeamTask.assignee_id == current_user.id)
 
     if status:
         query = query.filter(TeamTask.status == status)
 
-    tasks = query.order_by(TeamTask.due_date.asc().nullslast(), TeamTask.created_at.desc()).all()
-
-    task_responses = []
-    for task in tasks:
-        task_responses.append(TaskResponse(
-            id=task.id,
-            team_id=task.team_id,
-            title=task.title,
-            description=task.description,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            completed_at=task.completed_at,
-            assignee_id=task.assignee_id,
-            assignee_name=current_user.username,
-            created_by_id=task.created_by_id,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        ))
-
-    return TaskListResponse(tasks=task_responses, total=len(task_responses))
+    rows = query.order_by(TeamTask.due_date.asc().nullslast(), TeamTask.created_at.desc()).all()
+
+    # Built from our own DB rows, so skip re-validating every field
+    return TaskListResponse.model_construct(
+        tasks=[
+            TaskResponse.model_construct(**row._mapping, assignee_name=current_user.display_name)
+            for row in rows
+        ],
+        total=len(rows),
+    )
@@ -11,16 +11,18 @@ Endpoints:
 - POST /workflows/{id}/clone - Clone workflow
 """
 
-from typing import List, Optional, AsyncGenerator
+from typing import List, Optional, AsyncGenerator, Union
 from datetime import datetime
 from collections import defaultdict
 import json
 import asyncio
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
@@ -131,6 +133,115 @@ class WorkflowUpdate(BaseModel):
     status: Optional[str] = None
 
 
+# =============================================================================
+# Payload Structs
+# =============================================================================
+# Workflow and mission endpoints encode these with msgspec instead of building
+# to_dict() dicts; the JSON shape matches AgentWorkflow.to_dict /
+# WorkflowMission.to_dict.
+
+class WorkflowSummaryRow(msgspec.Struct):
+    """AgentWorkflow.to_dict(include_dag=False)."""
+
+    id: str
+    user_id: Optional[str]
+    name: str
+    name_cn: Optional[str]
+    description: Optional[str]
+    icon: str
+    is_template: bool
+    template_category: Optional[str]
+    status: str
+    version: int
+    node_count: int
+    edge_count: int
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+
+class WorkflowRow(WorkflowSummaryRow):
+    """AgentWorkflow.to_dict(), including the DAG."""
+
+    nodes: list
+    edges: list
+    default_settings: dict
+
+
+class MissionProgress(msgspec.Struct):
+    current: int
+    total: int
+
+
+class MissionRow(msgspec.Struct):
+    """WorkflowMission.to_dict()."""
+
+    id: str
+    workflow_id: str
+    user_id: str
+    leader_type: str
+    leader_name: str
+    description: str
+    status: str
+    progress: MissionProgress
+    result: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    sub_tasks: list
+
+
+_msgspec_encoder = msgspec.json.Encoder()
+
+
+def workflow_to_row(workflow: AgentWorkflow, include_dag: bool = True) -> WorkflowSummaryRow:
+    """Build the response struct for a workflow."""
+    fields = (
+        workflow.id,
+        workflow.user_id,
+        workflow.name,
+        workflow.name_cn,
+        workflow.description,
+        workflow.icon,
+        workflow.is_template,
+        workflow.template_category,
+        workflow.status,
+        workflow.version,
+        len(workflow.nodes) if workflow.nodes else 0,
+        len(workflow.edges) if workflow.edges else 0,
+        workflow.created_at,
+        workflow.updated_at,
+    )
+    if include_dag:
+        return WorkflowRow(*fields, workflow.nodes or [], workflow.edges or [], workflow.default_settings or {})
+    return WorkflowSummaryRow(*fields)
+
+
+def mission_to_row(mission: WorkflowMission) -> MissionRow:
+    """Build the response struct for a mission."""
+    return MissionRow(
+        id=mission.id,
+        workflow_id=mission.workflow_id,
+        user_id=mission.user_id,
+        leader_type=mission.leader_type,
+        leader_name=mission.leader_name,
+        description=mission.description,
+        status=mission.status,
+        progress=MissionProgress(mission.progress_current, mission.progress_total),
+        result=mission.result,
+        created_at=mission.created_at,
+        updated_at=mission.updated_at,
+        started_at=mission.started_at,
+        completed_at=mission.completed_at,
+        sub_tasks=mission.sub_tasks or [],
+    )
+
+
+def _msgspec_response(payload: Union[dict, msgspec.Struct]) -> Response:
+    """Encode a payload struct (or a dict of them) with msgspec."""
+    return Response(_msgspec_encoder.encode(payload), media_type="application/json")
+
+
 # =============================================================================
 # 5 Predefined Workflow Templates
 # =============================================================================
@@ -339,9 +450,9 @@ async def list_workflows(
         AgentWorkflow.user_id == current_user.id
     ).order_by(AgentWorkflow.updated_at.desc()).all()
 
-    return {
-        "workflows": [w.to_dict(include_dag=False) for w in workflows]
-    }
+    return _msgspec_response({
+        "workflows": [workflow_to_row(w, include_dag=False) for w in workflows]
+    })
 
 
 @router.get("/templates")
@@ -356,31 +467,32 @@ async def list_templates(
     ).all()
 
     if not templates:
-        # Initialize templates
-        for tpl in WORKFLOW_TEMPLATES:
-            workflow = AgentWorkflow(
-                id=generate_uuid(),
-                user_id=None,  # System template
-                name=tpl["name"],
-                name_cn=tpl["name_cn"],
-                description=tpl["description"],
-                icon=tpl["icon"],
-                is_template=True,
-                template_category=tpl["template_category"],
-                nodes=tpl["nodes"],
-                edges=tpl["edges"],
-                status="active",
-            )
-            db.add(workflow)
+        # Initialize templates in one executemany
+        db.execute(insert(AgentWorkflow), [
+            {
+                "id": generate_uuid(),
+                "user_id": None,  # System template
+                "name": tpl["name"],
+                "name_cn": tpl["name_cn"],
+                "description": tpl["description"],
+                "icon": tpl["icon"],
+                "is_template": True,
+                "template_category": tpl["template_category"],
+                "nodes": tpl["nodes"],
+                "edges": tpl["edges"],
+                "status": "active",
+            }
+            for tpl in WORKFLOW_TEMPLATES
+        ])
         db.commit()
 
         templates = db.query(AgentWorkflow).filter(
             AgentWorkflow.is_template == True
         ).all()
 
-    return {
-        "templates": [t.to_dict() for t in templates]
-    }
+    return _msgspec_response({
+        "templates": [workflow_to_row(t) for t in templates]
+    })
 
 
 @router.post("")
@@ -418,7 +530,7 @@ async def create_workflow(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.get("/{workflow_id}")
@@ -445,7 +557,7 @@ async def get_workflow(
             detail="Access denied"
         )
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.put("/{workflow_id}")
@@ -502,7 +614,7 @@ async def update_workflow(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.delete("/{workflow_id}")
@@ -572,7 +684,7 @@ async def clone_workflow(
     db.commit()
     db.refresh(clone)
 
-    return clone.to_dict()
+    return _msgspec_response(workflow_to_row(clone))
 
 
 # =============================================================================
@@ -604,7 +716,7 @@ async def add_node(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.put("/{workflow_id}/nodes/{node_id}")
@@ -642,7 +754,7 @@ async def update_node(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.delete("/{workflow_id}/nodes/{node_id}")
@@ -678,7 +790,7 @@ async def delete_node(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.post("/{workflow_id}/edges")
@@ -712,7 +824,7 @@ async def add_edge(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.put("/{workflow_id}/edges/{edge_id}")
@@ -755,7 +867,7 @@ async def update_edge(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 @router.delete("/{workflow_id}/edges/{edge_id}")
@@ -783,7 +895,7 @@ async def delete_edge(
     db.commit()
     db.refresh(workflow)
 
-    return workflow.to_dict()
+    return _msgspec_response(workflow_to_row(workflow))
 
 
 # =============================================================================
@@ -849,9 +961,9 @@ async def list_missions(
         WorkflowMission.user_id == current_user.id
     ).order_by(WorkflowMission.created_at.desc()).all()
 
-    return {
-        "missions": [m.to_dict() for m in missions]
-    }
+    return _msgspec_response({
+        "missions": [mission_to_row(m) for m in missions]
+    })
 
 
 @router.post("/{workflow_id}/missions")
@@ -893,7 +1005,7 @@ async def create_mission(
     db.commit()
     db.refresh(mission)
 
-    return mission.to_dict()
+    return _msgspec_response(mission_to_row(mission))
 
 
 @router.get("/{workflow_id}/missions/{mission_id}")
@@ -913,7 +1025,7 @@ async def get_mission(
     if not mission:
         raise HTTPException(status_code=404, detail="Mission not found")
 
-    return mission.to_dict()
+    return _msgspec_response(mission_to_row(mission))
 
 
 @router.put("/{workflow_id}/missions/{mission_id}")
@@ -956,7 +1068,7 @@ async def update_mission(
     db.commit()
     db.refresh(mission)
 
-    return mission.to_dict()
+    return _msgspec_response(mission_to_row(mission))
 
 
 @router.delete("/{workflow_id}/missions/{mission_id}")
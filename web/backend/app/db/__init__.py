@@ -1,6 +1,10 @@
 """Database package."""
 
-from app.db.database import get_db, init_db, engine, SessionLocal
+from app.db.database import get_db, get_async_db, init_db, engine, async_engine, SessionLocal, AsyncSessionLocal
 from app.db.models import User, UserSettings, ResearchSession
 
-__all__ = ["get_db", "init_db", "engine", "SessionLocal", "User", "UserSettings", "ResearchSession"]
+__all__ = [
+    "get_db", "get_async_db", "init_db",
+    "engine", "async_engine", "SessionLocal", "AsyncSessionLocal",
+    "User", "UserSettings", "ResearchSession",
+]
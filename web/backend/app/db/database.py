@@ -3,13 +3,19 @@ SQLite database configuration.
 """
 
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from pathlib import Path
 
+import orjson
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-# Database file path - use /app/data in Docker (volume mounted) or local path for dev
+
+# Database file path - use /app/data in Docker (volume mounted) or local path for dev.
+# NEXEN_DB_FILE overrides both (the test suite points it at a temporary file).
 def get_db_path() -> Path:
+    if os.environ.get("NEXEN_DB_FILE"):
+        return Path(os.environ["NEXEN_DB_FILE"])
     # In Docker, use /app/data which is a persistent volume
     data_dir = Path("/app/data")
     if data_dir.exists():
@@ -20,17 +26,63 @@ def get_db_path() -> Path:
 
 DB_PATH = get_db_path()
 DATABASE_URL = f"sqlite:///{DB_PATH}"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
+
+def _json_dumps(value) -> str:
+    """JSON column serializer (orjson; non-string dict keys become strings like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON columns are parsed once when a row is loaded and kept on the instance;
+# orjson makes that single parse (and the dump on flush) cheaper than stdlib json.
+_JSON_SERIALIZATION = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
 
-# Create engine
+# Create engine. Sync sessions run on the threadpool and the streaming research
+# executor holds one for the whole run, so the pool is sized well above the
+# 5 + 10 default; max_overflow=0 keeps the connection count fixed.
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Required for SQLite
+    pool_size=50,
+    max_overflow=0,
+    pool_pre_ping=True,
     echo=False,
+    **_JSON_SERIALIZATION,
 )
 
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection SQLite settings.
+
+    WAL lets readers proceed while a write transaction is open, and with WAL
+    synchronous=NORMAL only fsyncs at checkpoints instead of on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for endpoints that should not block the event loop on DB I/O
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=50,
+    max_overflow=10,
+    pool_pre_ping=True,
+    echo=False,
+    **_JSON_SERIALIZATION,
+)
+
+event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+
+# expire_on_commit=False: attributes cannot be lazily reloaded under asyncio
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
     """Base class for ORM models."""
@@ -38,7 +90,11 @@ class Base(DeclarativeBase):
 
 
 def get_db():
-    """Dependency to get database session."""
+    """Dependency to get database session.
+
+    close() expunges every instance and returns the connection to the pool, so
+    nothing loaded in the request stays attached to it afterwards.
+    """
     db = SessionLocal()
     try:
         yield db
@@ -46,6 +102,12 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """Initialize database tables."""
     # Import all models to ensure they're registered
@@ -59,3 +121,64 @@ def init_db():
         run_migration()
     except Exception as e:
         print(f"Migration note: {e}")
+
+    # Runs ahead of 002: duplicate rows would block the unique indexes it creates
+    try:
+        from app.db.migrations.migration_008 import run_migration as dedupe_unique_pairs
+        dedupe_unique_pairs()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_002 import run_migration as create_missing_indexes
+        create_missing_indexes()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_003 import run_migration as backfill_json_defaults
+        backfill_json_defaults()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_004 import run_migration as drop_conversation_messages
+        drop_conversation_messages()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_005 import run_migration as add_research_message_count
+        add_research_message_count()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_006 import (
+            run_migration as backfill_conversation_message_count,
+        )
+        backfill_conversation_message_count()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_007 import run_migration as move_parsed_content
+        move_parsed_content()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    try:
+        from app.db.migrations.migration_009 import run_migration as drop_redundant_indexes
+        drop_redundant_indexes()
+    except Exception as e:
+        print(f"Migration note: {e}")
+
+    # Refresh planner statistics (sqlite_stat1). Without them SQLite guesses the
+    # selectivity of low-cardinality filters such as status = 'pending';
+    # analysis_limit keeps this to a bounded sample per index.
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("PRAGMA analysis_limit=400")
+            conn.exec_driver_sql("ANALYZE")
+    except Exception as e:
+        print(f"Analyze note: {e}")
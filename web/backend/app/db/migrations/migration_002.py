@@ -0,0 +1,29 @@
+"""
+Migration 002: Create indexes declared on the models for existing databases.
+
+create_all() only creates indexes together with their table, so indexes added
+to a model after its table already exists never reach older databases. This
+migration creates any declared index that is missing (CREATE INDEX IF NOT EXISTS).
+
+Run with: python -m app.db.migrations.migration_002
+"""
+
+from app.db.database import DB_PATH, Base, engine
+
+
+def run_migration():
+    """Run the migration."""
+    from app.db import models  # noqa: F401
+
+    print(f"Creating missing indexes on {DB_PATH}")
+
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+    print("Indexes verified")
+
+
+if __name__ == "__main__":
+    run_migration()
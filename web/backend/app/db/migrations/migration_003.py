@@ -0,0 +1,48 @@
+"""
+Migration 003: Backfill NULL JSON config columns on agent_profiles.
+
+The JSON config columns are now NOT NULL with '{}' / '[]' defaults, so
+readers no longer substitute empty values. Rows written before that may
+hold SQL NULL or a JSON 'null'; rewrite them to the empty default.
+
+Run with: python -m app.db.migrations.migration_003
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+# column -> empty JSON default
+JSON_DEFAULTS = {
+    "traits": "{}",
+    "responsibilities": "[]",
+    "pipeline_config": "{}",
+    "data_sources": "[]",
+    "enabled_skills": "[]",
+}
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Backfilling agent_profiles JSON defaults on {DB_PATH}")
+
+    if not inspect(engine).has_table("agent_profiles"):
+        return
+
+    with engine.begin() as conn:
+        for column, default in JSON_DEFAULTS.items():
+            result = conn.execute(
+                text(
+                    f"UPDATE agent_profiles SET {column} = :default "
+                    f"WHERE {column} IS NULL OR {column} = 'null'"
+                ),
+                {"default": default},
+            )
+            if result.rowcount:
+                print(f"Backfilled agent_profiles.{column}: {result.rowcount} rows")
+
+    print("Backfill completed")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,69 @@
+"""
+Migration 004: Drop the legacy conversations.messages JSON column.
+
+Chat messages live in the messages table, one row per turn. The JSON array
+on conversations is no longer mapped; any conversation that still has entries
+there and no rows in messages gets them copied over before the column is
+dropped (ALTER TABLE DROP COLUMN needs SQLite >= 3.35).
+
+Run with: python -m app.db.migrations.migration_004
+"""
+
+import json
+import uuid
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Dropping conversations.messages on {DB_PATH}")
+
+    inspector = inspect(engine)
+    if not inspector.has_table("conversations"):
+        return
+    if "messages" not in {column["name"] for column in inspector.get_columns("conversations")}:
+        return
+
+    with engine.begin() as conn:
+        legacy = conn.execute(text(
+            "SELECT c.id, c.messages FROM conversations c "
+            "WHERE c.messages IS NOT NULL AND c.messages NOT IN ('null', '[]') "
+            "AND NOT EXISTS (SELECT 1 FROM messages m WHERE m.conversation_id = c.id)"
+        )).all()
+
+        rows = []
+        for conversation_id, blob in legacy:
+            for entry in json.loads(blob) or []:
+                if not isinstance(entry, dict) or not entry.get("content"):
+                    continue
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "conversation_id": conversation_id,
+                    "role": entry.get("role", "user"),
+                    "content": entry["content"],
+                    "model": entry.get("model"),
+                    # SQLite DATETIME text uses a space separator
+                    "created_at": (entry.get("timestamp") or datetime.utcnow().isoformat()).replace("T", " "),
+                })
+        if rows:
+            conn.execute(
+                text(
+                    "INSERT INTO messages (id, conversation_id, role, content, model, "
+                    "prompt_tokens, completion_tokens, created_at) "
+                    "VALUES (:id, :conversation_id, :role, :content, :model, 0, 0, :created_at)"
+                ),
+                rows,
+            )
+            print(f"Copied {len(rows)} legacy messages into the messages table")
+
+        conn.execute(text("ALTER TABLE conversations DROP COLUMN messages"))
+
+    print("Column dropped")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,39 @@
+"""
+Migration 005: Add research_sessions.message_count.
+
+ResearchSession.to_dict used len(messages), which loads the whole JSON blob
+just to count it. The count is now a denormalized column; existing rows are
+backfilled from the stored array.
+
+Run with: python -m app.db.migrations.migration_005
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Adding research_sessions.message_count on {DB_PATH}")
+
+    inspector = inspect(engine)
+    if not inspector.has_table("research_sessions"):
+        return
+    if "message_count" in {column["name"] for column in inspector.get_columns("research_sessions")}:
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE research_sessions ADD COLUMN message_count INTEGER DEFAULT 0"
+        ))
+        backfilled = conn.execute(text(
+            "UPDATE research_sessions SET message_count = json_array_length(messages) "
+            "WHERE json_valid(messages) AND json_type(messages) = 'array'"
+        )).rowcount
+
+    print(f"Backfilled message_count on {backfilled} sessions")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,37 @@
+"""
+Migration 006: Backfill conversations.message_count.
+
+The column existed but was never maintained; Message.bulk_log now keeps it in
+step with the messages table. Conversations whose stored count disagrees with
+their rows (everything written before this change, plus legacy messages copied
+by migration 004) get it recomputed.
+
+Run with: python -m app.db.migrations.migration_006
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Backfilling conversations.message_count on {DB_PATH}")
+
+    inspector = inspect(engine)
+    if not inspector.has_table("conversations") or not inspector.has_table("messages"):
+        return
+
+    with engine.begin() as conn:
+        backfilled = conn.execute(text(
+            "UPDATE conversations SET message_count = "
+            "(SELECT COUNT(*) FROM messages m WHERE m.conversation_id = conversations.id) "
+            "WHERE COALESCE(message_count, -1) != "
+            "(SELECT COUNT(*) FROM messages m WHERE m.conversation_id = conversations.id)"
+        )).rowcount
+
+    print(f"Backfill completed ({backfilled} conversations)")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,42 @@
+"""
+Migration 007: Move documents.parsed_content into document_contents.
+
+The extracted text of a document can be megabytes; keeping it in the documents
+row made every listing and filter scan carry it. It now lives in the 1:1
+document_contents table (created by create_all). Existing text is copied over
+before the column is dropped (ALTER TABLE DROP COLUMN needs SQLite >= 3.35).
+
+Run with: python -m app.db.migrations.migration_007
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Moving documents.parsed_content on {DB_PATH}")
+
+    inspector = inspect(engine)
+    if not inspector.has_table("documents") or not inspector.has_table("document_contents"):
+        return
+    if "parsed_content" not in {column["name"] for column in inspector.get_columns("documents")}:
+        return
+
+    with engine.begin() as conn:
+        copied = conn.execute(text(
+            "INSERT INTO document_contents (document_id, content) "
+            "SELECT d.id, d.parsed_content FROM documents d "
+            "WHERE d.parsed_content IS NOT NULL "
+            "AND NOT EXISTS (SELECT 1 FROM document_contents c WHERE c.document_id = d.id)"
+        )).rowcount
+        print(f"Copied parsed content of {copied} documents")
+
+        conn.execute(text("ALTER TABLE documents DROP COLUMN parsed_content"))
+
+    print("Column dropped")
+
+
+if __name__ == "__main__":
+    run_migration()
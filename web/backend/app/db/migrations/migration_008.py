@@ -0,0 +1,58 @@
+"""
+Migration 008: Deduplicate team members and installed tools.
+
+team_members (team_id, user_id) and installed_tools (user_id, tool_id) now
+carry unique indexes so adding a member or installing a tool is a single
+INSERT ... ON CONFLICT DO NOTHING. The old check-then-insert could race and
+leave duplicate rows, which would stop those indexes from being created; this
+keeps the earliest row of each pair, recounts teams.member_count, and drops
+the non-unique ix_installed_tools_user_tool the unique index replaces.
+
+Runs before migration 002, which then creates the unique indexes.
+
+Run with: python -m app.db.migrations.migration_008
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import DB_PATH, engine
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Deduplicating team members and installed tools on {DB_PATH}")
+
+    inspector = inspect(engine)
+
+    def needs_dedupe(table: str, unique_index: str) -> bool:
+        # Once the unique index exists the table cannot hold duplicates
+        return inspector.has_table(table) and unique_index not in {
+            index["name"] for index in inspector.get_indexes(table)
+        }
+
+    with engine.begin() as conn:
+        if needs_dedupe("installed_tools", "uq_installed_tools_user_tool"):
+            removed = conn.execute(text(
+                "DELETE FROM installed_tools WHERE rowid NOT IN "
+                "(SELECT MIN(rowid) FROM installed_tools GROUP BY user_id, tool_id)"
+            )).rowcount
+            print(f"Removed {removed} duplicate installed tools")
+            conn.execute(text("DROP INDEX IF EXISTS ix_installed_tools_user_tool"))
+
+        if needs_dedupe("team_members", "uq_team_members_team_user"):
+            removed = conn.execute(text(
+                "DELETE FROM team_members WHERE rowid NOT IN "
+                "(SELECT MIN(rowid) FROM team_members GROUP BY team_id, user_id)"
+            )).rowcount
+            print(f"Removed {removed} duplicate team members")
+            if removed:
+                conn.execute(text(
+                    "UPDATE teams SET member_count = "
+                    "(SELECT COUNT(*) FROM team_members m WHERE m.team_id = teams.id)"
+                ))
+
+    print("Deduplication completed")
+
+
+if __name__ == "__main__":
+    run_migration()
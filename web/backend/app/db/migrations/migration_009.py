@@ -0,0 +1,42 @@
+"""
+Migration 009: Drop single-column indexes covered by composite indexes.
+
+Each of these indexed a foreign key that is also the leading column of a
+composite index on the same table (e.g. research_tasks.session_id and
+ix_task_session_order), so lookups and cascades can use the composite and the
+single-column copy only added write cost. The models no longer declare them;
+this drops them from existing databases.
+
+Run with: python -m app.db.migrations.migration_009
+"""
+
+from sqlalchemy import text
+
+from app.db.database import DB_PATH, engine
+
+REDUNDANT_INDEXES = (
+    "ix_agent_profiles_user_id",
+    "ix_installed_tools_user_id",
+    "ix_research_sessions_user_id",
+    "ix_search_histories_user_id",
+    "ix_documents_user_id",
+    "ix_messages_conversation_id",
+    "ix_research_tasks_session_id",
+    "ix_team_members_team_id",
+    "ix_agent_executions_session_id",
+)
+
+
+def run_migration():
+    """Run the migration."""
+    print(f"Dropping redundant indexes on {DB_PATH}")
+
+    with engine.begin() as conn:
+        for index_name in REDUNDANT_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    print("Redundant indexes dropped")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -4,7 +4,7 @@ SQLAlchemy ORM models for NEXEN application.
 Models:
 - User, UserSettings, ResearchSession (existing)
 - Conversation (AI Ask)
-- Document, Folder, DocumentChunk (My Library)
+- Document, DocumentContent, Folder, DocumentChunk (My Library)
 - ImageGeneration (AI Image)
 - WritingProject (AI Writing)
 - Report (AI Reports)
@@ -16,11 +16,17 @@ Models:
 """
 
 import uuid
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Optional, List
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, LargeBinary, Float
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, JSON, Integer, LargeBinary, Float, Index, desc, exists, func, insert, select, text, true, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from app.db.database import Base
 
@@ -29,19 +35,107 @@ def generate_uuid() -> str:
     return str(uuid.uuid4())
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form every DateTime column stores.
+
+    Replaces the deprecated datetime.utcnow; stays naive so new values compare
+    and serialize like the ones loaded back from SQLite.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+# Dialect-specific insert() constructs; both support ON CONFLICT ... RETURNING
+_DIALECT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+
+def insert_if_absent(session: Session, model, values: dict, conflict_columns: List[str]):
+    """INSERT ... ON CONFLICT (conflict_columns) DO NOTHING RETURNING the new row.
+
+    Returns the inserted instance, or None when a row with the same
+    conflict_columns already exists (they must be covered by a unique index).
+    One statement, so concurrent callers cannot both insert the same pair.
+    """
+    dialect_insert = _DIALECT_INSERTS[session.get_bind().dialect.name]
+    return session.scalars(
+        dialect_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=conflict_columns)
+        .returning(model)
+    ).first()
+
+
+# Large or filtered-on JSON documents: stored pre-parsed as JSONB on PostgreSQL
+# (containment queries can then use a GIN index), plain JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+
+class json_array_elements(FunctionElement):
+    """The elements of a JSON array column as rows of a text ``value`` column.
+
+    Use as ``json_array_elements(column).table_valued("value")``. Compiles to
+    json_each on SQLite and json(b)_array_elements_text on PostgreSQL.
+    """
+
+    inherit_cache = True
+    name = "json_array_elements"
+
+
+@compiles(json_array_elements)
+def _json_array_elements_sqlite(element, compiler, **kw):
+    return f"json_each({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_elements, "postgresql")
+def _json_array_elements_postgresql(element, compiler, **kw):
+    (column,) = element.clauses.clauses
+    kind = "jsonb" if isinstance(column.type.dialect_impl(compiler.dialect), JSONB) else "json"
+    value = compiler.process(column, **kw)
+    # The *_array_elements functions raise on a non-array (e.g. a JSON null),
+    # where json_each would just return no element rows
+    return (
+        f"{kind}_array_elements_text(CASE WHEN {kind}_typeof({value}) = 'array' "
+        f"THEN {value} ELSE '[]'::{kind} END)"
+    )
+
+
+class GUID(TypeDecorator):
+    """UUID key column: native 16-byte UUID on PostgreSQL, VARCHAR(36) elsewhere.
+
+    Values are hyphenated strings on the Python side on every backend, so ids
+    compare equal to the ones in URLs and existing SQLite rows keep their format.
+
+    Child tables (messages, document_chunks, search_histories, team_members)
+    keep GUID ids too: message and search-history ids are returned by the API
+    and used in URLs, chunk ids double as Qdrant point ids, and their FKs point
+    at GUID parents, so an integer PK would save little.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(PG_UUID(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else str(value)
+
+
 class User(Base):
     """User account model."""
     
     __tablename__ = "users"
     
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     display_name: Mapped[str] = mapped_column(String(100), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
     
     # Relationships
     settings: Mapped[Optional["UserSettings"]] = relationship("UserSettings", back_populates="user", uselist=False)
@@ -79,8 +173,8 @@ class UserSettings(Base):
 
     __tablename__ = "user_settings"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), unique=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), unique=True)
 
     # API Keys (encrypted in storage)
     openai_api_key: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -95,7 +189,7 @@ class UserSettings(Base):
     theme: Mapped[str] = mapped_column(String(20), default="dark")
     language: Mapped[str] = mapped_column(String(10), default="zh")
 
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="settings")
@@ -135,8 +229,8 @@ class APIUsageStats(Base):
 
     __tablename__ = "api_usage_stats"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     # Provider identification
     provider: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # openai, anthropic, google, deepseek, dashscope
@@ -154,8 +248,8 @@ class APIUsageStats(Base):
     # Model-level breakdown (JSON)
     model_usage: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # {"gpt-4o": {"requests": 5, "tokens": 1000, "cost": 0.05}}
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", backref="usage_stats")
@@ -181,20 +275,26 @@ class ResearchSession(Base):
     """Research session model."""
     
     __tablename__ = "research_sessions"
+    __table_args__ = (
+        # Session listing: a user's sessions, most recently updated first
+        Index("ix_research_session_user_updated", "user_id", desc("updated_at")),
+    )
     
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
     
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(20), default="active")  # active, archived
+    status: Mapped[str] = mapped_column(String(20), default="active")  # active, completed, failed, archived
     
     # Session data stored as JSON
-    messages: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
-    research_results: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    messages: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
+    research_results: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)
+    # Denormalized len(messages) so listings never load the messages blob
+    message_count: Mapped[int] = mapped_column(Integer, default=0)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="sessions")
@@ -210,7 +310,7 @@ class ResearchSession(Base):
             "status": self.status,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "message_count": len(self.messages) if self.messages else 0,
+            "message_count": self.message_count or 0,
         }
 
 
@@ -223,8 +323,8 @@ class Conversation(Base):
 
     __tablename__ = "conversations"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     title: Mapped[str] = mapped_column(String(200), default="New Chat")
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -233,20 +333,20 @@ class Conversation(Base):
     is_bookmarked: Mapped[bool] = mapped_column(Boolean, default=False)
     is_archived: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    # Messages stored as JSON array
-    messages: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
+    # Messages are rows of the messages table (Message.conversation / message_list)
 
     # Usage stats
     message_count: Mapped[int] = mapped_column(Integer, default=0)
     total_tokens: Mapped[int] = mapped_column(Integer, default=0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="conversations")
 
-    def to_dict(self, include_messages: bool = False) -> dict:
+    def to_dict(self, messages: Optional[List["Message"]] = None) -> dict:
+        """Serialize the conversation; pass pre-loaded ``messages`` to include them."""
         data = {
             "id": self.id,
             "user_id": self.user_id,
@@ -260,8 +360,17 @@ class Conversation(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
-        if include_messages:
-            data["messages"] = self.messages or []
+        if messages is not None:
+            data["messages"] = [
+                {
+                    "id": m.id,
+                    "role": m.role,
+                    "content": m.content,
+                    "model": m.model,
+                    "created_at": m.created_at.isoformat() if m.created_at else None,
+                }
+                for m in messages
+            ]
         return data
 
 
@@ -269,9 +378,13 @@ class Message(Base):
     """Chat message in a conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Conversation history in chronological order
+        Index("ix_messages_conv_created", "conversation_id", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    conversation_id: Mapped[str] = mapped_column(String(36), ForeignKey("conversations.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    conversation_id: Mapped[str] = mapped_column(GUID(), ForeignKey("conversations.id", ondelete="CASCADE"))
 
     role: Mapped[str] = mapped_column(String(20), nullable=False)  # user, assistant, system
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -281,11 +394,26 @@ class Message(Base):
     prompt_tokens: Mapped[int] = mapped_column(Integer, default=0)
     completion_tokens: Mapped[int] = mapped_column(Integer, default=0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     conversation: Mapped["Conversation"] = relationship("Conversation", backref="message_list")
 
+    @classmethod
+    def bulk_log(cls, session: Session, conversation_id: str, turns: List[dict]) -> None:
+        """Insert chat turns (dicts of Message columns) for a conversation in one statement.
+
+        Also bumps the conversation's denormalized message_count in the same
+        transaction, so callers never need to COUNT(*) the messages table.
+        """
+        if turns:
+            session.execute(insert(cls), [{**turn, "conversation_id": conversation_id} for turn in turns])
+            session.execute(
+                update(Conversation)
+                .where(Conversation.id == conversation_id)
+                .values(message_count=Conversation.message_count + len(turns))
+            )
+
 
 # =============================================================================
 # My Library Module - Document, Folder, DocumentChunk
@@ -296,16 +424,16 @@ class Folder(Base):
 
     __tablename__ = "folders"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
-    parent_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("folders.id", ondelete="CASCADE"), nullable=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    parent_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("folders.id", ondelete="CASCADE"), nullable=True)
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     color: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)  # For UI
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="folders")
@@ -329,10 +457,15 @@ class Document(Base):
     """Document in the knowledge library."""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Library listing: a user's documents (optionally in one folder), newest first
+        Index("ix_documents_user_updated", "user_id", desc("updated_at")),
+        Index("ix_documents_user_folder_updated", "user_id", "folder_id", desc("updated_at")),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
-    folder_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("folders.id", ondelete="SET NULL"), nullable=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
+    folder_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("folders.id", ondelete="SET NULL"), nullable=True)
 
     # Basic info
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -344,23 +477,55 @@ class Document(Base):
     # Parse status
     parse_status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, parsing, completed, failed
     parse_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    parsed_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Plain text content
 
     # Embedding status
     embedding_status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, processing, completed, failed
     chunk_count: Mapped[int] = mapped_column(Integer, default=0)
 
     # Metadata
-    tags: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
-    doc_metadata: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # Author, page count, etc.
+    tags: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
+    doc_metadata: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)  # Author, page count, etc.
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="documents")
     folder: Mapped[Optional["Folder"]] = relationship("Folder", back_populates="documents")
     chunks: Mapped[list["DocumentChunk"]] = relationship("DocumentChunk", back_populates="document", cascade="all, delete-orphan")
+    content_row: Mapped[Optional["DocumentContent"]] = relationship(
+        "DocumentContent", back_populates="document", uselist=False, cascade="all, delete-orphan"
+    )
+
+    # Tags are a JSON array; both helpers below expand it with
+    # json_array_elements so filtering and counting run in the database, not in Python
+
+    @classmethod
+    def has_tag(cls, tag: str):
+        """SQL predicate: the document's tags array contains ``tag``."""
+        tag_values = json_array_elements(cls.tags).table_valued("value")
+        return exists().where(tag_values.c.value == tag)
+
+    @classmethod
+    def tag_counts(cls, session: Session, user_id: str) -> List[tuple]:
+        """(tag, document count) pairs for a user's documents, most used first."""
+        tag_values = json_array_elements(cls.tags).table_valued("value")
+        count = func.count().label("count")
+        return session.execute(
+            select(tag_values.c.value, count)
+            .select_from(cls)
+            .join(tag_values, true())
+            # json_each over a JSON null yields a single NULL value
+            .where(cls.user_id == user_id, tag_values.c.value.isnot(None))
+            .group_by(tag_values.c.value)
+            .order_by(count.desc(), tag_values.c.value)
+        ).all()
+
+    # Plain text content, stored in document_contents so listing and filtering
+    # the documents table never reads the extracted text
+    parsed_content = association_proxy(
+        "content_row", "content", creator=lambda content: DocumentContent(content=content)
+    )
 
     def to_dict(self) -> dict:
         return {
@@ -381,13 +546,25 @@ class Document(Base):
         }
 
 
+class DocumentContent(Base):
+    """Parsed plain text of a document, split out of the documents table."""
+
+    __tablename__ = "document_contents"
+
+    document_id: Mapped[str] = mapped_column(GUID(), ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True)
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Relationships
+    document: Mapped["Document"] = relationship("Document", back_populates="content_row")
+
+
 class DocumentChunk(Base):
     """Document chunk for vector search."""
 
     __tablename__ = "document_chunks"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    document_id: Mapped[str] = mapped_column(String(36), ForeignKey("documents.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    document_id: Mapped[str] = mapped_column(GUID(), ForeignKey("documents.id", ondelete="CASCADE"), index=True)
 
     chunk_index: Mapped[int] = mapped_column(Integer, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -399,11 +576,27 @@ class DocumentChunk(Base):
     # Metadata for retrieval
     chunk_metadata: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # page_number, section, etc.
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     document: Mapped["Document"] = relationship("Document", back_populates="chunks")
 
+    @classmethod
+    def bulk_create(cls, session: Session, rows: List[dict]) -> None:
+        """Insert many chunks in one executemany, bypassing the unit of work.
+
+        ``rows`` are plain dicts keyed by DocumentChunk column names (no ORM
+        instances, so nothing enters the identity map); omitted columns get
+        their column defaults. A Core insert is portable across dialects, and
+        SQLAlchemy batches it with insertmanyvalues where the driver needs it.
+        ``created_at`` is stamped once for the whole batch instead of calling
+        the Python default per row.
+        """
+        if rows:
+            session.execute(
+                insert(cls).values(created_at=utcnow()), rows
+            )
+
 
 # =============================================================================
 # AI Explore Module - SearchHistory
@@ -413,19 +606,29 @@ class SearchHistory(Base):
     """Search history for AI Explore."""
 
     __tablename__ = "search_histories"
+    __table_args__ = (
+        # Search history listing: a user's searches, newest first
+        Index("ix_search_user_created", "user_id", desc("created_at")),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
 
     query: Mapped[str] = mapped_column(Text, nullable=False)
     results_count: Mapped[int] = mapped_column(Integer, default=0)
     filters: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Applied filters
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="search_histories")
 
+    @classmethod
+    def bulk_log(cls, session: Session, user_id: str, entries: List[dict]) -> None:
+        """Insert search history entries (dicts of SearchHistory columns) for a user in one statement."""
+        if entries:
+            session.execute(insert(cls), [{**entry, "user_id": user_id} for entry in entries])
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -445,8 +648,8 @@ class ImageGeneration(Base):
 
     __tablename__ = "image_generations"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     prompt: Mapped[str] = mapped_column(Text, nullable=False)
     negative_prompt: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -469,7 +672,7 @@ class ImageGeneration(Base):
     # Cost tracking
     cost_credits: Mapped[float] = mapped_column(Float, default=0.0)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="image_generations")
@@ -501,8 +704,8 @@ class WritingProject(Base):
 
     __tablename__ = "writing_projects"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     template_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # article, report, email, essay, etc.
@@ -519,10 +722,10 @@ class WritingProject(Base):
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, completed, archived
 
     # AI assistance history
-    ai_history: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
+    ai_history: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="writing_projects")
@@ -554,9 +757,9 @@ class Report(Base):
 
     __tablename__ = "reports"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
-    research_session_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("research_sessions.id", ondelete="SET NULL"), nullable=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    research_session_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("research_sessions.id", ondelete="SET NULL"), nullable=True)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     template_type: Mapped[str] = mapped_column(String(50), default="standard")  # standard, executive, technical, research
@@ -566,10 +769,10 @@ class Report(Base):
     content_html: Mapped[str] = mapped_column(Text, default="")
 
     # Sections stored as JSON
-    sections: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
+    sections: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
 
     # Charts configuration
-    charts_data: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
+    charts_data: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
 
     # Status
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, completed, exported
@@ -579,8 +782,8 @@ class Report(Base):
     export_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     exported_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="reports")
@@ -615,34 +818,34 @@ class DecisionAnalysis(Base):
 
     __tablename__ = "decision_analyses"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Decision matrix data
-    options: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # [{id, name, description}]
-    criteria: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # [{id, name, description, type}]
-    weights: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # {criteria_id: weight}
-    scores: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # {option_id: {criteria_id: score}}
+    options: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)  # [{id, name, description}]
+    criteria: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)  # [{id, name, description, type}]
+    weights: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)  # {criteria_id: weight}
+    scores: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)  # {option_id: {criteria_id: score}}
 
     # Calculated results
-    results: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # {option_id: total_score}
-    ranking: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # Sorted option IDs
+    results: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)  # {option_id: total_score}
+    ranking: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)  # Sorted option IDs
 
     # Scenario simulation
-    scenarios: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # [{name, weight_adjustments, results}]
-    simulation_results: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    scenarios: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)  # [{name, weight_adjustments, results}]
+    simulation_results: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)
 
     # AI recommendation
     ai_recommendation: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    ai_analysis: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    ai_analysis: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)
 
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, completed
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="decision_analyses")
@@ -679,8 +882,8 @@ class Team(Base):
 
     __tablename__ = "teams"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    owner_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    owner_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -692,8 +895,8 @@ class Team(Base):
     # Stats
     member_count: Mapped[int] = mapped_column(Integer, default=1)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     owner: Mapped["User"] = relationship("User", back_populates="owned_teams", foreign_keys=[owner_id])
@@ -717,15 +920,19 @@ class TeamMember(Base):
     """Team member."""
 
     __tablename__ = "team_members"
+    __table_args__ = (
+        # One membership per user per team; conflict target when adding members
+        Index("uq_team_members_team_user", "team_id", "user_id", unique=True),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    team_id: Mapped[str] = mapped_column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), index=True)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    team_id: Mapped[str] = mapped_column(GUID(), ForeignKey("teams.id", ondelete="CASCADE"))
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     role: Mapped[str] = mapped_column(String(20), default="member")  # owner, admin, member
     permissions: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
 
-    joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    joined_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="members")
@@ -747,10 +954,10 @@ class TeamTask(Base):
 
     __tablename__ = "team_tasks"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    team_id: Mapped[str] = mapped_column(String(36), ForeignKey("teams.id", ondelete="CASCADE"), index=True)
-    assignee_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    created_by_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"))
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    team_id: Mapped[str] = mapped_column(GUID(), ForeignKey("teams.id", ondelete="CASCADE"), index=True)
+    assignee_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_by_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -762,10 +969,10 @@ class TeamTask(Base):
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     # Tags and metadata
-    tags: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
+    tags: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="tasks")
@@ -798,9 +1005,16 @@ class InstalledTool(Base):
     """Installed tool from the tool store."""
 
     __tablename__ = "installed_tools"
+    __table_args__ = (
+        # One installation per tool per user; also serves the per-tool lookups
+        # (get / update / toggle) and the install upsert's conflict target
+        Index("uq_installed_tools_user_tool", "user_id", "tool_id", unique=True),
+        # Installed tools listing: a user's tools, newest first
+        Index("ix_installed_tools_user_installed", "user_id", desc("installed_at")),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
 
     tool_id: Mapped[str] = mapped_column(String(100), nullable=False)  # Unique tool identifier
     tool_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -809,14 +1023,14 @@ class InstalledTool(Base):
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # User configuration for this tool
-    config: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    config: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)
 
     # Usage stats
     usage_count: Mapped[int] = mapped_column(Integer, default=0)
     last_used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    installed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    installed_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="installed_tools")
@@ -844,9 +1058,14 @@ class AgentProfile(Base):
     """Agent configuration profile for multi-agent research system."""
 
     __tablename__ = "agent_profiles"
+    __table_args__ = (
+        # Profile listing: filter by owner (and cluster), newest first
+        Index("ix_agentprofile_user_created", "user_id", desc("created_at")),
+        Index("ix_agentprofile_user_cluster", "user_id", "cluster"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"))
 
     # Agent identification
     agent_type: Mapped[str] = mapped_column(String(50), nullable=False)  # meta_coordinator, explorer, logician, etc.
@@ -863,20 +1082,20 @@ class AgentProfile(Base):
 
     # Persona configuration
     persona: Mapped[str] = mapped_column(Text, default="")  # System prompt / persona description
-    traits: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # {"risk_preference": "high", "creativity": "medium"}
-    responsibilities: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # ["文献检索", "趋势分析"]
+    traits: Mapped[dict] = mapped_column(JSONDocument, nullable=False, default=dict, server_default="{}")  # {"risk_preference": "high", "creativity": "medium"}
+    responsibilities: Mapped[list] = mapped_column(JSONDocument, nullable=False, default=list, server_default="[]")  # ["文献检索", "趋势分析"]
 
     # Pipeline configuration (Module 1/2/3)
-    pipeline_config: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    pipeline_config: Mapped[dict] = mapped_column(JSONDocument, nullable=False, default=dict, server_default="{}")
 
     # Data sources and skills
-    data_sources: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # ["arxiv", "semantic_scholar"]
-    enabled_skills: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # ["/survey", "/paper-deep-dive"]
+    data_sources: Mapped[list] = mapped_column(JSONDocument, nullable=False, default=list, server_default="[]")  # ["arxiv", "semantic_scholar"]
+    enabled_skills: Mapped[list] = mapped_column(JSONDocument, nullable=False, default=list, server_default="[]")  # ["/survey", "/paper-deep-dive"]
 
     is_enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="agent_profiles")
@@ -901,11 +1120,11 @@ class AgentProfile(Base):
         }
         if include_config:
             data["persona"] = self.persona
-            data["traits"] = self.traits or {}
-            data["responsibilities"] = self.responsibilities or []
-            data["pipeline_config"] = self.pipeline_config or {}
-            data["data_sources"] = self.data_sources or []
-            data["enabled_skills"] = self.enabled_skills or []
+            data["traits"] = self.traits
+            data["responsibilities"] = self.responsibilities
+            data["pipeline_config"] = self.pipeline_config
+            data["data_sources"] = self.data_sources
+            data["enabled_skills"] = self.enabled_skills
         return data
 
 
@@ -913,11 +1132,15 @@ class AgentExecution(Base):
     """Agent execution record for tracking agent activities."""
 
     __tablename__ = "agent_executions"
+    __table_args__ = (
+        # Session detail: a session's executions in creation order
+        Index("ix_exec_session_created", "session_id", "created_at"),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
-    agent_profile_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("agent_profiles.id", ondelete="SET NULL"), nullable=True)
-    research_task_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("research_tasks.id", ondelete="SET NULL"), nullable=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    session_id: Mapped[str] = mapped_column(GUID(), ForeignKey("research_sessions.id", ondelete="CASCADE"))
+    agent_profile_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("agent_profiles.id", ondelete="SET NULL"), nullable=True)
+    research_task_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("research_tasks.id", ondelete="SET NULL"), nullable=True)
 
     # Agent info (denormalized for historical record)
     agent_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -928,9 +1151,9 @@ class AgentExecution(Base):
     status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, running, completed, failed
 
     # Input/Output
-    input_context: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)
+    input_context: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)
     output_result: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    structured_output: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # key_findings, uncertainties, suggestions
+    structured_output: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=dict)  # key_findings, uncertainties, suggestions
 
     # Performance metrics
     tokens_used: Mapped[int] = mapped_column(Integer, default=0)
@@ -947,7 +1170,7 @@ class AgentExecution(Base):
 
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     session: Mapped["ResearchSession"] = relationship("ResearchSession", back_populates="agent_executions")
@@ -980,10 +1203,22 @@ class ResearchTask(Base):
     """Research task decomposition for multi-agent coordination."""
 
     __tablename__ = "research_tasks"
-
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
-    parent_task_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("research_tasks.id", ondelete="CASCADE"), nullable=True)
+    __table_args__ = (
+        # Session tasks in execution order, and lookups by status
+        Index("ix_task_session_order", "session_id", "execution_order"),
+        Index("ix_task_session_status", "session_id", "status"),
+        # Pending tasks in execution order (scheduler / execute); partial, so
+        # it only holds rows that are still waiting to run
+        Index(
+            "ix_task_session_pending", "session_id", "execution_order",
+            sqlite_where=text("status = 'pending'"),
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    session_id: Mapped[str] = mapped_column(GUID(), ForeignKey("research_sessions.id", ondelete="CASCADE"))
+    parent_task_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("research_tasks.id", ondelete="CASCADE"), nullable=True)
 
     # Task details
     description: Mapped[str] = mapped_column(Text, nullable=False)
@@ -992,7 +1227,7 @@ class ResearchTask(Base):
     status: Mapped[str] = mapped_column(String(20), default="pending")  # pending, in_progress, completed, failed, blocked
 
     # Execution order and dependencies
-    dependencies: Mapped[Optional[dict]] = mapped_column(JSON, default=list)  # [task_id, ...]
+    dependencies: Mapped[Optional[dict]] = mapped_column(JSONDocument, default=list)  # [task_id, ...]
     execution_order: Mapped[int] = mapped_column(Integer, default=0)
     execution_group: Mapped[int] = mapped_column(Integer, default=0)  # For parallel execution
 
@@ -1018,14 +1253,20 @@ class ResearchTask(Base):
     # Output
     output: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     session: Mapped["ResearchSession"] = relationship("ResearchSession", back_populates="research_tasks")
     parent_task: Mapped[Optional["ResearchTask"]] = relationship("ResearchTask", remote_side=[id], backref="subtasks")
     execution: Mapped[Optional["AgentExecution"]] = relationship("AgentExecution", back_populates="research_task", uselist=False)
 
+    @classmethod
+    def depends_on(cls, task_id: str):
+        """SQL predicate: the task's dependencies array contains ``task_id``."""
+        dependency_ids = json_array_elements(cls.dependencies).table_valued("value")
+        return exists().where(dependency_ids.c.value == task_id)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -1056,8 +1297,8 @@ class TaskPlan(Base):
 
     __tablename__ = "task_plans"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    session_id: Mapped[str] = mapped_column(GUID(), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
 
     version: Mapped[int] = mapped_column(Integer, default=1)
     original_task: Mapped[str] = mapped_column(Text, nullable=False)
@@ -1068,7 +1309,7 @@ class TaskPlan(Base):
 
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, active, completed, revised
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -1094,10 +1335,10 @@ class AgentOutput(Base):
 
     __tablename__ = "agent_outputs"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
-    execution_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("agent_executions.id", ondelete="SET NULL"), nullable=True)
-    task_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("research_tasks.id", ondelete="SET NULL"), nullable=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    session_id: Mapped[str] = mapped_column(GUID(), ForeignKey("research_sessions.id", ondelete="CASCADE"), index=True)
+    execution_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("agent_executions.id", ondelete="SET NULL"), nullable=True)
+    task_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("research_tasks.id", ondelete="SET NULL"), nullable=True)
 
     agent_type: Mapped[str] = mapped_column(String(50), nullable=False)
     output_type: Mapped[str] = mapped_column(String(30), default="markdown")  # markdown, json, yaml
@@ -1109,7 +1350,7 @@ class AgentOutput(Base):
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     key_findings: Mapped[Optional[dict]] = mapped_column(JSON, default=list)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
     # Relationships
     session: Mapped["ResearchSession"] = relationship("ResearchSession", backref="agent_outputs")
@@ -1141,8 +1382,8 @@ class AgentWorkflow(Base):
 
     __tablename__ = "agent_workflows"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    user_id: Mapped[Optional[str]] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    user_id: Mapped[Optional[str]] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
     # user_id is nullable - null means system template
 
     # Basic info
@@ -1170,8 +1411,8 @@ class AgentWorkflow(Base):
     status: Mapped[str] = mapped_column(String(20), default="draft")  # draft, active, archived
     version: Mapped[int] = mapped_column(Integer, default=1)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     user: Mapped[Optional["User"]] = relationship("User", back_populates="agent_workflows")
@@ -1212,9 +1453,9 @@ class WorkflowMission(Base):
 
     __tablename__ = "workflow_missions"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
-    workflow_id: Mapped[str] = mapped_column(String(36), ForeignKey("agent_workflows.id", ondelete="CASCADE"), index=True)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    id: Mapped[str] = mapped_column(GUID(), primary_key=True, default=generate_uuid)
+    workflow_id: Mapped[str] = mapped_column(GUID(), ForeignKey("agent_workflows.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[str] = mapped_column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), index=True)
 
     # Mission info
     leader_type: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -1239,8 +1480,8 @@ class WorkflowMission(Base):
     notification_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
     started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
@@ -1270,3 +1511,4 @@ class WorkflowMission(Base):
         if include_sub_tasks:
             data["sub_tasks"] = self.sub_tasks or []
         return data
+
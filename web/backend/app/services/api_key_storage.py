@@ -29,6 +29,9 @@ DEFAULT_STORAGE_PATH = get_storage_path_default()
 # Thread lock for file operations
 _file_lock = Lock()
 
+# Parsed key file, reused until the file changes: (path, mtime_ns, size) -> data
+_keys_cache: Optional[tuple[tuple[str, int, int], Dict[str, Dict[str, str]]]] = None
+
 
 def _get_storage_path() -> Path:
     """Get the API keys storage file path."""
@@ -52,9 +55,33 @@ def _load_all_keys() -> Dict[str, Dict[str, str]]:
         return {}
 
 
+def _load_all_keys_cached() -> Dict[str, Dict[str, str]]:
+    """
+    Load all API keys, reusing the last parse while the file is unchanged.
+
+    The returned dict is shared and must not be mutated; writers use _load_all_keys().
+    """
+    global _keys_cache
+    path = _get_storage_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if _keys_cache is not None and _keys_cache[0] == key:
+        return _keys_cache[1]
+
+    data = _load_all_keys()
+    _keys_cache = (key, data)
+    return data
+
+
 def _save_all_keys(data: Dict[str, Dict[str, str]]) -> bool:
     """Save all API keys to file."""
+    global _keys_cache
     path = _get_storage_path()
+    _keys_cache = None
     try:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
@@ -76,7 +103,7 @@ def get_user_api_keys(user_id: str) -> Dict[str, Optional[str]]:
     Note: For single-user local deployment, falls back to "default" keys if user-specific keys not found.
     """
     with _file_lock:
-        all_keys = _load_all_keys()
+        all_keys = _load_all_keys_cached()
 
         # Try user-specific keys first
         user_keys = all_keys.get(user_id, {})
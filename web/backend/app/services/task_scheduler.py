@@ -2,15 +2,18 @@
 Task scheduler service for managing research task lifecycle.
 
 Handles task planning, claiming, dependency checking, and status updates.
+
+Not wired into the app yet: the research executor (api/research.py) still
+runs tasks by execution_group on its own.
 """
 
 import logging
-from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
-from app.db.models import ResearchTask, TaskPlan, AgentOutput, ResearchSession
+from app.db.models import ResearchTask, TaskPlan, AgentOutput, ResearchSession, generate_uuid, utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -72,11 +75,12 @@ class TaskScheduler:
             raise ValueError(f"Plan not found: {plan_id}")
 
         plan.status = "active"
-        plan.activated_at = datetime.utcnow()
+        plan.activated_at = utcnow()
 
         # Create ResearchTask records from plan_data
         subtasks = plan.plan_data.get("subtasks", [])
         task_id_map = {}  # Map subtask index to created task ID
+        task_rows = []
 
         for i, subtask in enumerate(subtasks):
             # Resolve dependencies
@@ -85,22 +89,25 @@ class TaskScheduler:
                 if dep_idx in task_id_map:
                     dependencies.append(task_id_map[dep_idx])
 
-            task = ResearchTask(
-                session_id=plan.session_id,
-                description=subtask.get("description", ""),
-                assigned_agent=subtask.get("agent", "meta_coordinator"),
-                priority=subtask.get("priority", "medium"),
-                status="pending",
-                dependencies=dependencies,
-                execution_order=subtask.get("order", i),
-                execution_group=subtask.get("group", 0),
-                created_by="meta_coordinator",
-                timeout_seconds=subtask.get("timeout", 300),
-            )
-            self.db.add(task)
-            self.db.flush()  # Get the ID
-            task_id_map[i] = task.id
-
+            # IDs are assigned here rather than by a flush, so every task can
+            # go out in a single executemany below
+            task_id_map[i] = generate_uuid()
+            task_rows.append({
+                "id": task_id_map[i],
+                "session_id": plan.session_id,
+                "description": subtask.get("description", ""),
+                "assigned_agent": subtask.get("agent", "meta_coordinator"),
+                "priority": subtask.get("priority", "medium"),
+                "status": "pending",
+                "dependencies": dependencies,
+                "execution_order": subtask.get("order", i),
+                "execution_group": subtask.get("group", 0),
+                "created_by": "meta_coordinator",
+                "timeout_seconds": subtask.get("timeout", 300),
+            })
+
+        if task_rows:
+            self.db.execute(insert(ResearchTask), task_rows)
         self.db.commit()
         self.db.refresh(plan)
 
@@ -122,12 +129,22 @@ class TaskScheduler:
         Returns:
             Updated ResearchTask with status='in_progress'
         """
-        task = self.db.query(ResearchTask).filter(ResearchTask.id == task_id).first()
-        if not task:
-            raise ValueError(f"Task not found: {task_id}")
+        # Claim with one conditional UPDATE: of several agents racing for the
+        # same task only one matches status='pending', the rest get no row
+        task = self.db.scalars(
+            update(ResearchTask)
+            .where(ResearchTask.id == task_id, ResearchTask.status == "pending")
+            .values(status="in_progress", claimed_at=utcnow(), claimed_by=agent_type)
+            .returning(ResearchTask)
+        ).first()
 
-        if task.status != "pending":
-            raise ValueError(f"Task {task_id} is not in pending state (current: {task.status})")
+        if not task:
+            current_status = self.db.query(ResearchTask.status).filter(
+                ResearchTask.id == task_id
+            ).scalar()
+            if current_status is None:
+                raise ValueError(f"Task not found: {task_id}")
+            raise ValueError(f"Task {task_id} is not in pending state (current: {current_status})")
 
         # Verify agent assignment
         if task.assigned_agent != agent_type:
@@ -135,12 +152,7 @@ class TaskScheduler:
                 f"Agent {agent_type} claiming task assigned to {task.assigned_agent}"
             )
 
-        task.status = "in_progress"
-        task.claimed_at = datetime.utcnow()
-        task.claimed_by = agent_type
-
         self.db.commit()
-        self.db.refresh(task)
 
         logger.info(f"Agent {agent_type} claimed task {task_id}")
         return task
@@ -246,12 +258,19 @@ class TaskScheduler:
             ResearchTask.execution_order
         ).all()
 
-        ready_tasks = []
-        for task in pending_tasks:
-            if await self.check_dependencies(task):
-                ready_tasks.append(task)
+        # One query for the session's completed task ids instead of one
+        # lookup per dependency per pending task
+        completed_ids = {
+            task_id for (task_id,) in self.db.query(ResearchTask.id).filter(
+                ResearchTask.session_id == session_id,
+                ResearchTask.status == "completed",
+            )
+        }
 
-        return ready_tasks
+        return [
+            task for task in pending_tasks
+            if not task.dependencies or completed_ids.issuperset(task.dependencies)
+        ]
 
     async def check_dependencies(self, task: ResearchTask) -> bool:
         """
@@ -266,14 +285,12 @@ class TaskScheduler:
         if not task.dependencies:
             return True
 
-        for dep_task_id in task.dependencies:
-            dep_task = self.db.query(ResearchTask).filter(
-                ResearchTask.id == dep_task_id
-            ).first()
-            if not dep_task or dep_task.status != "completed":
-                return False
-
-        return True
+        dep_ids = set(task.dependencies)
+        completed = self.db.query(ResearchTask.id).filter(
+            ResearchTask.id.in_(dep_ids),
+            ResearchTask.status == "completed",
+        ).count()
+        return completed == len(dep_ids)
 
     async def get_dependency_outputs(
         self,
@@ -292,10 +309,14 @@ class TaskScheduler:
         if not task.dependencies:
             return outputs
 
+        # Fetch all dependencies in one IN query, then keep dependency order
+        dep_tasks = {
+            dep.id: dep for dep in self.db.query(ResearchTask).filter(
+                ResearchTask.id.in_(task.dependencies)
+            )
+        }
         for dep_task_id in task.dependencies:
-            dep_task = self.db.query(ResearchTask).filter(
-                ResearchTask.id == dep_task_id
-            ).first()
+            dep_task = dep_tasks.get(dep_task_id)
             if dep_task and dep_task.output_files:
                 outputs.append({
                     "task_id": dep_task_id,
@@ -359,17 +380,19 @@ class TaskScheduler:
 
     async def _update_dependent_tasks_inputs(self, completed_task: ResearchTask) -> None:
         """Update input_files for tasks that depend on the completed task."""
+        if not completed_task.output_files:
+            return
+
+        # Only the tasks whose dependencies array holds this task's id
         dependent_tasks = self.db.query(ResearchTask).filter(
             ResearchTask.session_id == completed_task.session_id,
+            ResearchTask.depends_on(completed_task.id),
         ).all()
 
         for task in dependent_tasks:
-            if task.dependencies and completed_task.id in task.dependencies:
-                # Add completed task's output files to this task's input
-                current_inputs = task.input_files or []
-                if completed_task.output_files:
-                    current_inputs.extend(completed_task.output_files)
-                task.input_files = current_inputs
+            # Add completed task's output files to this task's input. A new
+            # list, so the JSON column registers the change
+            task.input_files = [*(task.input_files or []), *completed_task.output_files]
 
         self.db.commit()
 
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the backend tests.
+
+The database and API key file paths are resolved when app modules are first
+imported, so both are pointed at a temporary directory before that happens.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import uuid
+
+_TMP_DIR = tempfile.mkdtemp(prefix="nexen-tests-")
+atexit.register(shutil.rmtree, _TMP_DIR, ignore_errors=True)
+os.environ["NEXEN_DB_FILE"] = os.path.join(_TMP_DIR, "nexen.db")
+os.environ["API_KEYS_FILE"] = os.path.join(_TMP_DIR, "api_keys.json")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.db.database import SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client; entering it runs the app lifespan, which calls init_db."""
+    with TestClient(app) as test_client:
+        yield test_client
+    engine.dispose()
+
+
+@pytest.fixture
+def db(client):
+    """A database session on the test database."""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_user(client):
+    """Register a new user; returns (auth headers, /auth/me payload, email)."""
+
+    def _make_user(display_name: str = "Tester"):
+        email = f"user-{uuid.uuid4().hex[:12]}@example.com"
+        response = client.post("/api/auth/register", json={
+            "email": email, "password": "secret123", "display_name": display_name,
+        })
+        assert response.status_code in (200, 201), response.text
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        me = client.get("/api/auth/me", headers=headers).json()
+        return headers, me, email
+
+    return _make_user
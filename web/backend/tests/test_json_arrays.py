@@ -0,0 +1,63 @@
+"""
+JSON array membership helpers: json_each on SQLite, and the equivalent
+json(b)_array_elements_text query on PostgreSQL.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import Document, ResearchSession, ResearchTask
+
+
+def _postgresql_sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_document_tag_helpers(db, make_user):
+    _, me, _ = make_user()
+    db.add_all([
+        Document(user_id=me["id"], name="a", file_type="md", tags=["ml", "nlp"]),
+        Document(user_id=me["id"], name="b", file_type="md", tags=["ml"]),
+        Document(user_id=me["id"], name="c", file_type="md", tags=[]),
+        Document(user_id=me["id"], name="d", file_type="md", tags=None),
+    ])
+    db.commit()
+
+    tagged = db.scalars(
+        select(Document.name).where(Document.user_id == me["id"], Document.has_tag("ml"))
+    ).all()
+
+    assert sorted(tagged) == ["a", "b"]
+    assert Document.tag_counts(db, me["id"]) == [("ml", 2), ("nlp", 1)]
+
+
+def test_document_tag_helpers_compile_for_postgresql():
+    sql = _postgresql_sql(select(Document.id).where(Document.has_tag("ml")))
+
+    assert "json_each" not in sql
+    assert "jsonb_array_elements_text(CASE WHEN jsonb_typeof(documents.tags) = 'array'" in sql
+
+
+def test_research_task_depends_on(db, make_user):
+    _, me, _ = make_user()
+    session = ResearchSession(user_id=me["id"], name="Session")
+    db.add(session)
+    db.flush()
+    first = ResearchTask(session_id=session.id, description="first", assigned_agent="explorer")
+    db.add(first)
+    db.flush()
+    db.add_all([
+        ResearchTask(session_id=session.id, description="after first", assigned_agent="critic",
+                     dependencies=[first.id]),
+        ResearchTask(session_id=session.id, description="independent", assigned_agent="critic",
+                     dependencies=[]),
+    ])
+    db.commit()
+
+    dependents = db.scalars(
+        select(ResearchTask.description).where(ResearchTask.depends_on(first.id))
+    ).all()
+
+    assert dependents == ["after first"]
+    sql = _postgresql_sql(select(ResearchTask.id).where(ResearchTask.depends_on("t")))
+    assert "jsonb_array_elements_text(CASE WHEN jsonb_typeof(research_tasks.dependencies)" in sql
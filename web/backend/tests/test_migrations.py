@@ -0,0 +1,83 @@
+"""
+init_db runs every hand-written migration on each startup, so running it
+again on a populated database must be a no-op.
+"""
+
+from sqlalchemy import inspect, text
+
+from app.db.database import engine, init_db
+from app.db.models import ResearchSession, ResearchTask, TeamMember
+
+
+def _snapshot():
+    """Row count and index names of every table."""
+    inspector = inspect(engine)
+    with engine.connect() as conn:
+        return {
+            table: (
+                conn.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar(),
+                sorted(index["name"] for index in inspector.get_indexes(table)),
+            )
+            for table in inspector.get_table_names()
+        }
+
+
+def _populate(client, db, make_user):
+    headers, me, _ = make_user("Owner")
+    _, _, member_email = make_user("Member")
+    team_id = client.post("/api/teams/teams", json={"name": "Team"}, headers=headers).json()["id"]
+    response = client.post(
+        f"/api/teams/teams/{team_id}/members", json={"email": member_email}, headers=headers
+    )
+    assert response.status_code == 201, response.text
+
+    session = ResearchSession(user_id=me["id"], name="Session")
+    db.add(session)
+    db.flush()
+    db.add_all([
+        ResearchTask(
+            session_id=session.id, description=f"task {i}", assigned_agent="explorer",
+            execution_order=i,
+        )
+        for i in range(3)
+    ])
+    db.commit()
+    return team_id
+
+
+def test_init_db_twice_is_a_no_op(client, db, make_user, capsys):
+    _populate(client, db, make_user)
+    before = _snapshot()
+
+    init_db()
+    init_db()
+
+    assert "Migration note" not in capsys.readouterr().out
+    assert _snapshot() == before
+
+
+def test_init_db_dedupes_an_older_database_once(client, db, make_user, capsys):
+    team_id = _populate(client, db, make_user)
+    member = db.query(TeamMember).filter(
+        TeamMember.team_id == team_id, TeamMember.role != "owner"
+    ).one()
+
+    # A database from before the unique index, holding a duplicate membership
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_team_members_team_user"))
+    db.add(TeamMember(team_id=team_id, user_id=member.user_id))
+    db.commit()
+
+    init_db()
+    after_first = _snapshot()
+    init_db()
+
+    assert "Migration note" not in capsys.readouterr().out
+    assert _snapshot() == after_first
+    assert "uq_team_members_team_user" in after_first["team_members"][1]
+    with engine.connect() as conn:
+        members, member_count = conn.execute(text(
+            "SELECT (SELECT COUNT(*) FROM team_members WHERE team_id = :id), member_count "
+            "FROM teams WHERE id = :id"
+        ), {"id": team_id}).one()
+    assert members == member_count == 2
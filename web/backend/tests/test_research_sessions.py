@@ -0,0 +1,56 @@
+"""
+Research session endpoints.
+"""
+
+from app.api import research
+from app.auth.security import encrypt_api_key
+from app.db.models import ResearchSession, ResearchTask, UserSettings
+
+
+def _user_with_api_key(db, make_user):
+    headers, me, _ = make_user()
+    settings = db.query(UserSettings).filter(UserSettings.user_id == me["id"]).one()
+    settings.openai_api_key = encrypt_api_key("sk-test")
+    db.commit()
+    return headers
+
+
+def test_create_session_without_subtasks(client, db, make_user, monkeypatch):
+    async def no_subtasks(task, api_keys):
+        return []
+
+    monkeypatch.setattr(research, "decompose_task_with_llm", no_subtasks)
+    headers = _user_with_api_key(db, make_user)
+
+    response = client.post(
+        "/api/research/sessions", json={"name": "Empty", "task": "t"}, headers=headers
+    )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["task_count"], body["tasks"]) == (0, [])
+    assert client.get(f"/api/research/sessions/{body['id']}", headers=headers).status_code == 200
+    assert db.query(ResearchTask).filter(ResearchTask.session_id == body["id"]).count() == 0
+
+
+def test_task_pages_add_up_to_total(client, db, make_user):
+    # The frontend's fetchAllPages reads page after page until it has `total` items
+    headers, me, _ = make_user()
+    session = ResearchSession(user_id=me["id"], name="Big")
+    db.add(session)
+    db.flush()
+    db.add_all([
+        ResearchTask(session_id=session.id, description=f"task {i}", assigned_agent="explorer",
+                     execution_order=i)
+        for i in range(5)
+    ])
+    db.commit()
+
+    url = f"/api/research/sessions/{session.id}/tasks"
+    pages = [client.get(url, params={"page": page, "page_size": 2}, headers=headers).json()
+             for page in (1, 2, 3)]
+
+    assert {page["total"] for page in pages} == {5}
+    assert [t["description"] for page in pages for t in page["tasks"]] == [
+        f"task {i}" for i in range(5)
+    ]
@@ -0,0 +1,137 @@
+"""
+Research executor: a client disconnecting mid-run must leave the session's
+tasks in a state a later execute can pick up.
+"""
+
+import asyncio
+import uuid
+
+import anyio
+
+from app.api import research
+from app.db.models import AgentExecution, ResearchSession, ResearchTask, User
+
+
+def _session_with_tasks(db, descriptions):
+    user = User(email=f"{uuid.uuid4().hex[:12]}@example.com", password_hash="x", display_name="U")
+    db.add(user)
+    db.flush()
+    session = ResearchSession(user_id=user.id, name="Session")
+    db.add(session)
+    db.flush()
+    db.add_all([
+        ResearchTask(
+            session_id=session.id, description=description, assigned_agent="explorer",
+            execution_group=0, execution_order=i,
+        )
+        for i, description in enumerate(descriptions)
+    ])
+    db.commit()
+    return session
+
+
+def _pending_tasks(db, session):
+    return db.query(ResearchTask).filter(
+        ResearchTask.session_id == session.id, ResearchTask.status == "pending"
+    ).order_by(ResearchTask.execution_order).all()
+
+
+def _fake_agent(cancelled, hang=True):
+    """execute_agent_task stand-in: "fast" tasks finish at once; with hang=True
+    every other task blocks until cancelled."""
+
+    async def execute_agent_task(task_description, agent_type, agent_profile, api_keys):
+        try:
+            if hang and task_description != "fast":
+                await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(task_description)
+            raise
+        return {
+            "status": "completed", "output_result": f"result of {task_description}",
+            "tokens_used": 1, "duration_ms": 5, "model_used": "test", "error_message": None,
+        }
+
+    return execute_agent_task
+
+
+async def _run_and_disconnect(stream):
+    """Consume the stream until the first task completes, then cancel it the
+    way the response does when the client goes away (a cancel scope, which
+    also cancels every later await in the generator's cleanup)."""
+    with anyio.CancelScope() as scope:
+        async for event in stream:
+            if b'"task_completed"' in event:
+                scope.cancel()
+
+
+async def test_disconnect_mid_group_resets_unfinished_tasks(db, monkeypatch):
+    cancelled = []
+    monkeypatch.setattr(research, "execute_agent_task", _fake_agent(cancelled))
+    session = _session_with_tasks(db, ["fast", "slow 1", "slow 2"])
+
+    await _run_and_disconnect(research.stream_research_execution(
+        session, _pending_tasks(db, session), {}, {"openai": "key"}, db,
+    ))
+    await asyncio.sleep(0.05)
+
+    db.expire_all()
+    tasks = db.query(ResearchTask).filter(ResearchTask.session_id == session.id).all()
+    assert {t.description: t.status for t in tasks} == {
+        "fast": "completed", "slow 1": "pending", "slow 2": "pending",
+    }
+    assert {t.description: t.output for t in tasks}["fast"] == "result of fast"
+    executions = db.query(AgentExecution).filter(AgentExecution.session_id == session.id).all()
+    assert [e.task_description for e in executions] == ["fast"]
+    assert sorted(cancelled) == ["slow 1", "slow 2"]
+
+
+
+async def test_execute_after_disconnect_completes_the_session(db, monkeypatch):
+    monkeypatch.setattr(research, "execute_agent_task", _fake_agent([]))
+    session = _session_with_tasks(db, ["fast", "slow 1", "slow 2"])
+    await _run_and_disconnect(research.stream_research_execution(
+        session, _pending_tasks(db, session), {}, {"openai": "key"}, db,
+    ))
+
+    async def fake_synthesis(**kwargs):
+        yield "report"
+
+    # The client reconnects and executes again: only the reset tasks run
+    monkeypatch.setattr(research, "execute_agent_task", _fake_agent([], hang=False))
+    monkeypatch.setattr(research, "stream_agent_task", fake_synthesis)
+    pending = _pending_tasks(db, session)
+    assert [t.description for t in pending] == ["slow 1", "slow 2"]
+    events = [event async for event in research.stream_research_execution(
+        session, pending, {}, {"openai": "key"}, db,
+    )]
+
+    assert b'"type":"completed"' in events[-1]
+    db.expire_all()
+    assert db.get(ResearchSession, session.id).status == "completed"
+    tasks = db.query(ResearchTask).filter(ResearchTask.session_id == session.id).all()
+    assert {t.status for t in tasks} == {"completed"}
+    executions = db.query(AgentExecution).filter(AgentExecution.session_id == session.id).all()
+    assert sorted(e.research_task_id for e in executions) == sorted(t.id for t in tasks)
+
+
+async def test_synthesis_failure_marks_the_session_failed(db, monkeypatch):
+    async def broken_synthesis(**kwargs):
+        yield "# Partial"
+        raise ConnectionError("connection reset")
+
+    monkeypatch.setattr(research, "execute_agent_task", _fake_agent([], hang=False))
+    monkeypatch.setattr(research, "stream_agent_task", broken_synthesis)
+    session = _session_with_tasks(db, ["fast"])
+
+    events = [event async for event in research.stream_research_execution(
+        session, _pending_tasks(db, session), {}, {"openai": "key"}, db,
+    )]
+
+    assert b'"type":"synthesis_failed"' in events[-1]
+    assert not any(b'"type":"synthesis_completed"' in event for event in events)
+    db.expire_all()
+    stored = db.get(ResearchSession, session.id)
+    assert stored.status == "failed"
+    assert stored.research_results["synthesis"] is None
+    assert stored.research_results["synthesis_error"] == "connection reset"
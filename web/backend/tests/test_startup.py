@@ -0,0 +1,20 @@
+"""
+Importing the app must stay cheap: litellm (several seconds to import) is only
+loaded by the endpoints that call a model.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+
+def test_importing_the_app_does_not_import_litellm():
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, app.main; print('litellm' in sys.modules)"],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
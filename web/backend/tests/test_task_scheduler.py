@@ -0,0 +1,87 @@
+"""
+TaskScheduler: plan activation, task claiming and dependency hand-off.
+"""
+
+import uuid
+
+import pytest
+
+from app.db.models import ResearchSession, ResearchTask, User
+from app.services.task_scheduler import TaskScheduler
+
+
+@pytest.fixture
+def session_id(db):
+    user = User(email=f"{uuid.uuid4().hex[:12]}@example.com", password_hash="x", display_name="U")
+    db.add(user)
+    db.flush()
+    session = ResearchSession(user_id=user.id, name="Session")
+    db.add(session)
+    db.commit()
+    return session.id
+
+
+async def _activate(db, session_id):
+    """Plan a -> b -> c (c also depends on a); returns the tasks by description."""
+    scheduler = TaskScheduler(db)
+    plan = await scheduler.create_task_plan(session_id, "question", {"subtasks": [
+        {"description": "a", "agent": "explorer"},
+        {"description": "b", "agent": "logician", "dependencies": [0]},
+        {"description": "c", "agent": "critic", "dependencies": [0, 1], "group": 1},
+    ]})
+    await scheduler.activate_plan(plan.id)
+    tasks = db.query(ResearchTask).filter(ResearchTask.session_id == session_id).all()
+    return scheduler, {task.description: task for task in tasks}
+
+
+async def test_activate_plan_creates_tasks_with_resolved_dependencies(db, session_id):
+    scheduler, tasks = await _activate(db, session_id)
+
+    assert {name: task.status for name, task in tasks.items()} == {
+        "a": "pending", "b": "pending", "c": "pending",
+    }
+    assert tasks["a"].dependencies == []
+    assert tasks["b"].dependencies == [tasks["a"].id]
+    assert tasks["c"].dependencies == [tasks["a"].id, tasks["b"].id]
+    assert [t.description for t in await scheduler.get_ready_tasks(session_id)] == ["a"]
+
+
+async def test_claim_task_has_a_single_winner(db, session_id):
+    scheduler, tasks = await _activate(db, session_id)
+
+    claimed = await scheduler.claim_task(tasks["a"].id, "explorer")
+
+    assert (claimed.status, claimed.claimed_by) == ("in_progress", "explorer")
+    assert claimed.claimed_at is not None
+    with pytest.raises(ValueError, match="not in pending state"):
+        await scheduler.claim_task(tasks["a"].id, "explorer")
+    with pytest.raises(ValueError, match="Task not found"):
+        await scheduler.claim_task("missing", "explorer")
+
+
+async def test_complete_task_hands_output_files_to_dependents(db, session_id):
+    scheduler, tasks = await _activate(db, session_id)
+    await scheduler.claim_task(tasks["a"].id, "explorer")
+
+    await scheduler.complete_task(tasks["a"].id, "findings", ["a.md"])
+
+    db.expire_all()
+    assert tasks["a"].status == "completed"
+    assert tasks["b"].input_files == ["a.md"]
+    assert tasks["c"].input_files == ["a.md"]
+    # c still waits for b
+    assert [t.description for t in await scheduler.get_ready_tasks(session_id)] == ["b"]
+
+
+async def test_fail_task_retries_then_fails(db, session_id):
+    scheduler, tasks = await _activate(db, session_id)
+    task_id = tasks["a"].id
+
+    for attempt in range(1, 3):
+        await scheduler.claim_task(task_id, "explorer")
+        task = await scheduler.fail_task(task_id, "timeout")
+        assert (task.status, task.retry_count, task.claimed_by) == ("pending", attempt, None)
+
+    await scheduler.claim_task(task_id, "explorer")
+    task = await scheduler.fail_task(task_id, "timeout")
+    assert (task.status, task.retry_count) == ("failed", 3)
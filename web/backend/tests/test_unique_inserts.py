@@ -0,0 +1,57 @@
+"""
+Installing a tool and adding a team member are single INSERT ... ON CONFLICT
+DO NOTHING statements; a repeat must report a conflict and leave one row.
+"""
+
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.db.models import InstalledTool, TeamMember, insert_if_absent
+
+
+def test_duplicate_install_returns_409(client, db, make_user):
+    headers, me, _ = make_user()
+
+    first = client.post("/api/store/install", json={"tool_id": "pubmed_search"}, headers=headers)
+    second = client.post("/api/store/install", json={"tool_id": "pubmed_search"}, headers=headers)
+
+    assert first.status_code == 201, first.text
+    assert second.status_code == 409
+    assert db.query(InstalledTool).filter(InstalledTool.user_id == me["id"]).count() == 1
+
+
+def test_duplicate_add_member_returns_409(client, db, make_user):
+    headers, _, _ = make_user("Owner")
+    _, member, member_email = make_user("Member")
+    team_id = client.post("/api/teams/teams", json={"name": "Team"}, headers=headers).json()["id"]
+    url = f"/api/teams/teams/{team_id}/members"
+
+    first = client.post(url, json={"email": member_email}, headers=headers)
+    second = client.post(url, json={"email": member_email}, headers=headers)
+
+    assert first.status_code == 201, first.text
+    assert first.json()["username"] == "Member"
+    assert second.status_code == 409
+    assert db.query(TeamMember).filter(TeamMember.team_id == team_id).count() == 2
+    teams = client.get("/api/teams/teams", headers=headers).json()["teams"]
+    assert [t["member_count"] for t in teams if t["id"] == team_id] == [2]
+
+
+def test_insert_if_absent_uses_the_postgresql_insert_on_postgresql():
+    compiled = []
+
+    class PostgresSession:
+        """Just enough of a Session to capture the statement."""
+
+        def get_bind(self):
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def scalars(self, statement):
+            compiled.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(first=lambda: None)
+
+    assert insert_if_absent(
+        PostgresSession(), TeamMember, {"team_id": "t", "user_id": "u"}, ["team_id", "user_id"]
+    ) is None
+    assert "ON CONFLICT (team_id, user_id) DO NOTHING RETURNING" in compiled[0]
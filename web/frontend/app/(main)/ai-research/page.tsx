@@ -130,7 +130,7 @@ export default function AIResearchPage() {
     const fetchSessions = async () => {
         try {
             setIsLoading(true);
-            const res = await researchApi.getSessions();
+            const res = await researchApi.getAllSessions();
             setSessions(res.sessions);
         } catch (err) {
             setError(err instanceof Error ? err.message : 'Failed to load sessions');
@@ -232,12 +232,28 @@ export default function AIResearchPage() {
                                 setCurrentProgress(event.data.progress);
                             }
                             break;
+                        case 'synthesis_delta': {
+                            // Show the report as it is written instead of
+                            // waiting for synthesis_complete
+                            const text = event.text;
+                            if (text) {
+                                setSynthesis((prev) => (prev ?? '') + text);
+                            }
+                            setActiveTab('results');
+                            break;
+                        }
                         case 'synthesis_complete':
                             if (event.data.synthesis) {
                                 setSynthesis(event.data.synthesis);
                             }
                             setActiveTab('results');
                             break;
+                        case 'synthesis_failed':
+                            // The streamed text was cut off; it is not a report
+                            setSynthesis(null);
+                            setError(event.error ?? 'Synthesis failed');
+                            fetchSessionDetails(selectedSession.id);
+                            break;
                         case 'session_completed':
                             fetchSessionDetails(selectedSession.id);
                             break;
@@ -236,6 +236,27 @@ async function fetchApiWithAuth<T>(endpoint: string, options?: RequestInit): Pro
     return response.json();
 }
 
+// Reads every page of a paginated list endpoint (page / page_size / total) for
+// callers that show the whole list, so it is not cut off at the default page size
+async function fetchAllPages<T>(
+    endpoint: string,
+    itemsKey: string,
+    pageSize = 200,
+): Promise<{ items: T[]; total: number }> {
+    const separator = endpoint.includes('?') ? '&' : '?';
+    const items: T[] = [];
+    for (let page = 1; ; page++) {
+        const res = await fetchApiWithAuth<{ total: number; [key: string]: unknown }>(
+            `${endpoint}${separator}page=${page}&page_size=${pageSize}`
+        );
+        const pageItems = res[itemsKey] as T[];
+        items.push(...pageItems);
+        if (pageItems.length < pageSize || items.length >= res.total) {
+            return { items, total: res.total };
+        }
+    }
+}
+
 async function fetchApiFormData<T>(endpoint: string, formData: FormData): Promise<T> {
     const response = await fetch(`${API_BASE}${endpoint}`, {
         method: 'POST',
@@ -1645,8 +1666,12 @@ export interface MemoryContent {
 export interface ResearchEvent {
     type: 'session_started' | 'decomposition_complete' | 'group_started' |
           'task_started' | 'task_progress' | 'task_completed' | 'task_failed' |
-          'group_completed' | 'synthesis_started' | 'synthesis_complete' |
-          'session_completed' | 'error';
+          'group_completed' | 'synthesis_started' | 'synthesis_delta' |
+          'synthesis_complete' | 'synthesis_failed' | 'session_completed' | 'error';
+    // synthesis_delta: the next piece of the report, streamed as it is generated
+    text?: string;
+    // synthesis_failed: why no report was produced (the session is marked failed)
+    error?: string;
     data: {
         session_id?: string;
         task_id?: string;
@@ -1679,6 +1704,15 @@ export const researchApi = {
         );
     },
 
+    // Every session, fetched page by page
+    getAllSessions: async (params?: { status?: string }) => {
+        const query = params?.status ? `?status=${encodeURIComponent(params.status)}` : '';
+        const { items, total } = await fetchAllPages<ResearchSession>(
+            `/research/sessions${query}`, 'sessions'
+        );
+        return { sessions: items, total };
+    },
+
     createSession: (data: ResearchSessionCreate) =>
         fetchApiWithAuth<ResearchSession>('/research/sessions', {
             method: 'POST',
@@ -1699,17 +1733,21 @@ export const researchApi = {
             method: 'DELETE',
         }),
 
-    // Tasks
-    getTasks: (sessionId: string) =>
-        fetchApiWithAuth<{ tasks: ResearchTaskItem[]; total: number }>(
-            `/research/sessions/${sessionId}/tasks`
-        ),
+    // Tasks (all pages)
+    getTasks: async (sessionId: string) => {
+        const { items, total } = await fetchAllPages<ResearchTaskItem>(
+            `/research/sessions/${sessionId}/tasks`, 'tasks'
+        );
+        return { tasks: items, total };
+    },
 
-    // Executions
-    getExecutions: (sessionId: string) =>
-        fetchApiWithAuth<{ executions: AgentExecution[]; total: number }>(
-            `/research/sessions/${sessionId}/executions`
-        ),
+    // Executions (all pages)
+    getExecutions: async (sessionId: string) => {
+        const { items, total } = await fetchAllPages<AgentExecution>(
+            `/research/sessions/${sessionId}/executions`, 'executions'
+        );
+        return { executions: items, total };
+    },
 
     // Memory
     getMemory: (sessionId: string, layer?: 'L0' | 'L1' | 'L2') => {
@@ -1746,19 +1784,25 @@ export const researchApi = {
 
         const reader = response.body?.getReader();
         const decoder = new TextDecoder();
+        // Network chunks can end mid-event (frequent with small synthesis
+        // deltas); keep the trailing partial line for the next read
+        let buffer = '';
 
         while (reader) {
             const { done, value } = await reader.read();
             if (done) break;
 
-            const chunk = decoder.decode(value);
-            const lines = chunk.split('\n');
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop() ?? '';
 
             for (const line of lines) {
                 if (line.startsWith('data: ')) {
                     try {
                         const data = JSON.parse(line.slice(6));
-                        if (data.error) {
+                        // Typed events (including synthesis_failed) go to the
+                        // page; a bare { error } frame aborts the run
+                        if (data.error && !data.type) {
                             onError?.(data.error);
                         } else {
                             onEvent(data as ResearchEvent);